@@ -0,0 +1,154 @@
+"""Cache the XML-based abstract syntax trees of Python source files on disk."""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, List, Tuple, Union
+
+import platformdirs
+import pyastgrep  # type: ignore
+from lxml import etree  # type: ignore
+
+from chasten import constants
+
+# create a parser that accepts the deeply nested XML that
+# results from deeply nested expressions in Python source code
+xml_parser = etree.XMLParser(huge_tree=True)
+
+# keep track of the number of times that the cache
+# did and did not contain the AST for a source file
+cache_hits = 0
+cache_misses = 0
+
+
+def get_cache_directory() -> Path:
+    """Return the directory that stores the cached abstract syntax trees."""
+    # use the platform-specific user cache directory detected by platformdirs
+    chasten_user_cache_dir_str = platformdirs.user_cache_dir(
+        appname=constants.chasten.Application_Name,
+        appauthor=constants.chasten.Application_Author,
+    )
+    return Path(chasten_user_cache_dir_str) / constants.chasten.Ast_Cache_Directory
+
+
+def is_enabled() -> bool:
+    """Determine whether or not the cache is enabled, which it is unless the environment disables it."""
+    return not os.environ.get(constants.chasten.Ast_Cache_Disable_Variable)
+
+
+def create_cache_key(contents: bytes) -> str:
+    """Create the key for the contents of a source file and the current versions of Python and pyastgrep."""
+    # the XML-based AST depends on the version of Python that parses
+    # the source code and the version of pyastgrep that converts the
+    # AST to XML and thus both are part of the key for the contents
+    contents_hash = hashlib.sha256(contents).hexdigest()
+    python_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    return f"{contents_hash}-{python_version}-{pyastgrep.__version__}"
+
+
+def load(contents: bytes) -> Union[Tuple[Any, List[str]], None]:
+    """Load the XML-based AST and the lines for the contents of a source file if they are cached."""
+    global cache_hits, cache_misses  # noqa: disable=PLW0603
+    if not is_enabled():
+        return None
+    cache_file = get_cache_directory() / create_cache_key(contents)
+    # the cache does not contain the contents or it is not possible to read
+    # the cached contents and thus the source file must be parsed again;
+    # note that a malformed entry can also lead to a TypeError
+    try:
+        with cache_file.open("rb") as cache_file_handle:
+            (xml_ast_bytes, file_lines) = pickle.load(cache_file_handle)
+        xml_ast = etree.fromstring(xml_ast_bytes, xml_parser)
+    except (
+        OSError,
+        EOFError,
+        TypeError,
+        ValueError,
+        pickle.UnpicklingError,
+        SyntaxError,
+    ):
+        cache_misses += 1
+        return None
+    # mark the entry as recently used so that pruning keeps it
+    try:
+        os.utime(cache_file)
+    except OSError:
+        pass
+    cache_hits += 1
+    return (xml_ast, file_lines)
+
+
+def save(contents: bytes, xml_ast: Any, file_lines: List[str]) -> None:
+    """Save the XML-based AST and the lines for the contents of a source file."""
+    if not is_enabled():
+        return None
+    cache_directory = get_cache_directory()
+    cache_file = cache_directory / create_cache_key(contents)
+    # write to a temporary file and then rename it so that a concurrent run of
+    # chasten never reads a partially written file; note that the cache is
+    # only an optimization and thus failing to write to it is not an error
+    try:
+        cache_directory.mkdir(parents=True, exist_ok=True)
+        (file_descriptor, temporary_name) = tempfile.mkstemp(dir=cache_directory)
+    except OSError:
+        return None
+    try:
+        with os.fdopen(file_descriptor, "wb") as temporary_file:
+            pickle.dump((etree.tostring(xml_ast), file_lines), temporary_file)
+        os.replace(temporary_name, cache_file)
+    except OSError:
+        # do not leave behind the partially written temporary file
+        try:
+            os.unlink(temporary_name)
+        except OSError:
+            pass
+    return None
+
+
+def prune(maximum_size: int = constants.chasten.Ast_Cache_Maximum_Size) -> int:
+    """Remove the least recently used cached ASTs until the cache is no larger than the maximum size."""
+    # collect the size and the time of last use for each cached AST;
+    # note that a missing cache directory is an empty cache
+    cache_entries = []
+    try:
+        with os.scandir(get_cache_directory()) as directory_entries:
+            for directory_entry in directory_entries:
+                if directory_entry.is_file(follow_symlinks=False):
+                    entry_stat = directory_entry.stat(follow_symlinks=False)
+                    cache_entries.append(
+                        (
+                            entry_stat.st_mtime_ns,
+                            entry_stat.st_size,
+                            directory_entry.path,
+                        )
+                    )
+    except OSError:
+        return 0
+    cache_size = sum(entry_size for (_, entry_size, _) in cache_entries)
+    removed_count = 0
+    # remove the entries that were used the longest time ago first
+    for _, entry_size, entry_path in sorted(cache_entries):
+        if cache_size <= maximum_size:
+            break
+        try:
+            os.unlink(entry_path)
+        except OSError:
+            continue
+        cache_size -= entry_size
+        removed_count += 1
+    return removed_count
+
+
+def get_statistics() -> Tuple[int, int]:
+    """Return the number of cache hits and cache misses."""
+    return (cache_hits, cache_misses)
+
+
+def add_statistics(hits: int, misses: int) -> None:
+    """Record cache hits and cache misses that took place in a separate process."""
+    global cache_hits, cache_misses  # noqa: disable=PLW0603
+    cache_hits += hits
+    cache_misses += misses
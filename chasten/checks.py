@@ -1,10 +1,24 @@
 """Extract and analyze details about specific checks."""
 
+from dataclasses import dataclass
 from typing import Dict, List, Tuple, Union
 
 from chasten import constants, enumerations, util
 
 
+@dataclass(frozen=True, slots=True)
+class CheckSpec:
+    """Define the CheckSpec dataclass for the details of a check that do not change during analysis."""
+
+    id: str
+    name: str
+    description: str
+    pattern: str
+    pattern_escaped: str
+    min: Union[int, None]
+    max: Union[int, None]
+
+
 def extract_min_max(
     check: Dict[str, Union[str, Dict[str, int]]]
 ) -> Tuple[Union[int, None], Union[int, None]]:
@@ -25,6 +39,28 @@ def extract_description(check: Dict[str, Union[str, Dict[str, int]]]) -> str:
     return ""
 
 
+def create_check_spec(check: Dict[str, Union[str, Dict[str, int]]]) -> CheckSpec:
+    """Create the specification of a check from its dictionary in the checks file."""
+    # extract the minimum and maximum values for the check, if they exist;
+    # note that this function will return None for a min or a max if
+    # that attribute does not exist inside of the check; importantly,
+    # having a count or a min or a max is all optional in a checks file
+    (min_count, max_count) = extract_min_max(check)
+    # extract the pattern (i.e., the XPATH expression) for the check
+    pattern = str(check[constants.checks.Check_Pattern])
+    return CheckSpec(
+        id=str(check[constants.checks.Check_Id]),
+        name=str(check[constants.checks.Check_Name]),
+        description=extract_description(check),
+        pattern=pattern,
+        # escape the open bracket symbol that may be in an XPATH expression
+        # and will prevent it from displaying correctly
+        pattern_escaped=pattern.replace("[", "\\["),
+        min=min_count,
+        max=max_count,
+    )
+
+
 def create_attribute_label(attribute: Union[str, int, None], label: str) -> str:
     """Create an attribute label string for display as long as it is not null."""
     # define an empty attribute string, which is
@@ -8,7 +8,6 @@ from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
 
 import platformdirs
-import requests
 import yaml
 from rich.logging import RichHandler
 from rich.traceback import install
@@ -396,6 +395,10 @@ def extract_configuration_details_from_config_url(
 
     chasten_user_config_url -- URL to config or checks yaml file.
     """
+    # import requests only when a configuration is downloaded
+    # since importing it slows down the start of every command
+    import requests
+
     # create request with given URL as source
     response = requests.get(str(chasten_user_config_url))
     # the URL response is OK
@@ -14,11 +14,16 @@ class Chasten:
     Application_Author: str
     App_Storage: Path
     API_Key_Storage: Path
+    Ast_Cache_Directory: str
+    Ast_Cache_Disable_Variable: str
+    Ast_Cache_Maximum_Size: int
     Chasten_Database_View: str
     Emoji: str
     Executable_Fly: str
     Executable_Vercel: str
     Https: str
+    Integrate_Fingerprint_Extension: str
+    Integrate_Fingerprint_File_Name: str
     Name: str
     Programming_Language: str
     Separator: str
@@ -35,11 +40,16 @@ chasten = Chasten(
     Application_Author="ChastenedTeam",
     App_Storage=Path("check.txt"),
     API_Key_Storage=Path("userapikey.txt"),
+    Ast_Cache_Directory="source-ast-cache",
+    Ast_Cache_Disable_Variable="CHASTEN_NO_AST_CACHE",
+    Ast_Cache_Maximum_Size=128 * 1024 * 1024,
     Chasten_Database_View="chasten_complete",
     Emoji=":dizzy:",
     Executable_Fly="fly",
     Executable_Vercel="vercel",
     Https="https://",
+    Integrate_Fingerprint_Extension="fingerprint",
+    Integrate_Fingerprint_File_Name=".chasten-integration",
     Name="chasten",
     Programming_Language="python",
     Separator="/",
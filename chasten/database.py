@@ -1,10 +1,10 @@
 """Mange the SQLite database containing results from chasten analyses."""
 
+import sqlite3
 import subprocess
 import sys
 from pathlib import Path
-
-from sqlite_utils import Database
+from typing import Dict, List
 
 from chasten import constants, enumerations, filesystem, output, util
 
@@ -33,55 +33,118 @@ ORDER BY
   datetime desc;
 """
 
+# the columns of each database table that support full-text search
+CHASTEN_FULL_TEXT_SEARCH_COLUMNS: Dict[str, List[str]] = {
+    "main": [
+        "configuration_chastenversion",
+        "configuration_projectname",
+        "configuration_datetime",
+    ],
+    "sources": [
+        "filename",
+        "check_id",
+        "check_name",
+        "check_description",
+        "check_pattern",
+    ],
+    "sources_check_matches": [
+        "lineno",
+        "coloffset",
+        "linematch",
+    ],
+}
+
+# the columns of each database table that link its rows to the rows of
+# another table; note that flatterer only indexes the primary keys
+CHASTEN_LINK_COLUMNS: Dict[str, List[str]] = {
+    "sources": ["_link_main"],
+    "sources_check_matches": ["_link_sources", "_link_main"],
+}
+
+# the settings of SQLite for quickly building the database a single time:
+# --> do not wait for the operating system to write changes to the disk
+# --> keep the temporary tables, indices, and rollback journal in memory
+# --> allow the cache of database pages to grow up to 256 megabytes
+# note that these settings only apply to the connection that builds the
+# database and that the database file keeps its default journal mode so
+# that datasette can serve and publish it from a read-only location
+CHASTEN_SQL_BULK_LOAD_PRAGMAS = """
+PRAGMA synchronous = OFF;
+PRAGMA journal_mode = MEMORY;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -262144;
+"""
+
 # create a small bullet for display in the output
 small_bullet_unicode = constants.markers.Small_Bullet_Unicode
 
 
-def create_chasten_view(chasten_database_name: str) -> None:
+def create_chasten_view(connection: sqlite3.Connection) -> None:
     """Create a view that combines results in the database tables."""
-    database = Database(chasten_database_name)
     # create a "virtual table" (i.e., a view) that is the result
     # of running the pre-defined query; note that this query
     # organizes all of chasten's results into a single table.
     # When using datasette each of the columns in this view
     # are "facetable" which means that they can be enabled or disabled
     # inside of the web-based user interface
-    database.create_view(
-        constants.chasten.Chasten_Database_View, CHASTEN_SQL_SELECT_QUERY
+    connection.execute(
+        f"CREATE VIEW {constants.chasten.Chasten_Database_View} AS {CHASTEN_SQL_SELECT_QUERY}"
     )
 
 
-def enable_full_text_search(chasten_database_name: str) -> None:
+def enable_full_text_search(connection: sqlite3.Connection) -> None:
     """Enable full-text search in the specific SQLite3 database."""
-    database = Database(chasten_database_name)
-    # enable full-text search on the main database table
-    database["main"].enable_fts(
-        [
-            "configuration_chastenversion",
-            "configuration_projectname",
-            "configuration_datetime",
-        ]
-    )
-    # enable full-text search on the sources database table
-    database["sources"].enable_fts(
-        [
-            "filename",
-            "check_id",
-            "check_name",
-            "check_description",
-            "check_pattern",
-        ]
-    )
-    # enable full-text search on the sources database table
-    database["sources_check_matches"].enable_fts(
-        [
-            "lineno",
-            "coloffset",
-            "linematch",
-        ]
-    )
-    # note that sqlite-utils does not support the enabling of
-    # full-text search on the view called chasten_complete
+    # enable full-text search on each of the database tables, creating the
+    # same FTS5 table that sqlite-utils creates so that datasette detects it,
+    # and then populate the index from the table inside of SQLite itself
+    for table_name, column_names in CHASTEN_FULL_TEXT_SEARCH_COLUMNS.items():
+        columns = ", ".join(f"[{column_name}]" for column_name in column_names)
+        connection.execute(
+            f"CREATE VIRTUAL TABLE [{table_name}_fts] USING FTS5 (\n"
+            + f"    {columns},\n"
+            + f"    content=[{table_name}]\n"
+            + ")"
+        )
+        connection.execute(
+            f"INSERT INTO [{table_name}_fts] (rowid, {columns})\n"
+            + f"    SELECT rowid, {columns} FROM [{table_name}];"
+        )
+    # note that full-text search is not enabled on the view called chasten_complete
+
+
+def create_link_indices(connection: sqlite3.Connection) -> None:
+    """Create an index for each of the columns that link the database tables."""
+    # index the links between tables so that datasette can quickly find, for
+    # instance, all of the matches for a source instead of scanning all of
+    # the matches; note that creating these indices after flatterer inserted
+    # all of the rows sorts the values once instead of updating the index
+    # for every inserted row
+    for table_name, column_names in CHASTEN_LINK_COLUMNS.items():
+        for column_name in column_names:
+            connection.execute(
+                f"CREATE INDEX [idx_{table_name}_{column_name}]"
+                + f" ON [{table_name}] ([{column_name}])"
+            )
+
+
+def configure_chasten_database(chasten_database_name: str) -> None:
+    """Create the view, full-text search, and indices in the SQLite3 database in a single transaction."""
+    # use a single connection and a single transaction for all of the changes
+    # to the database so that SQLite commits them to the disk only once
+    connection = sqlite3.connect(chasten_database_name, isolation_level=None)
+    try:
+        connection.executescript(CHASTEN_SQL_BULK_LOAD_PRAGMAS)
+        connection.execute("BEGIN")
+        try:
+            create_chasten_view(connection)
+            enable_full_text_search(connection)
+            create_link_indices(connection)
+        except sqlite3.Error:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+    finally:
+        connection.close()
 
 
 def display_final_diagnostic_message(datasette_platform: str, publish: bool):
@@ -1,9 +1,9 @@
 """Support and configure debugging."""
 
-from enum import Enum
+from enum import StrEnum
 
 
-class DebugLevel(str, Enum):
+class DebugLevel(StrEnum):
     """The predefined levels for debugging."""
 
     DEBUG = "DEBUG"
@@ -13,7 +13,7 @@ class DebugLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
-class DebugDestination(str, Enum):
+class DebugDestination(StrEnum):
     """The destination for debugging."""
 
     CONSOLE = "CONSOLE"
@@ -1,16 +1,42 @@
 """Check and access contents of the filesystem."""
 
+import hashlib
 import json
+import os
 import shutil
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, NoReturn, Optional, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import flatterer  # type: ignore
+from pydantic import TypeAdapter
 from rich.tree import Tree
 
-from chasten import configuration, constants, database, results
+from chasten import configuration, constants, results
+
+# serialize the results of an analysis directly to JSON bytes
+chasten_results_adapter = TypeAdapter(results.Chasten)
+
+# the largest number of threads that read JSON files at the same time
+json_read_maximum_threads = 64
+
+# use orjson, which is installed as a dependency of flatterer, to quickly
+# parse JSON files; fall back to the standard library when it is not available
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
 
 CONFIGURATION_FILE_DEFAULT_CONTENTS = """
 # chasten configuration
@@ -173,6 +199,22 @@ def get_default_directory_list() -> List[Path]:
     return default_directory_list
 
 
+def get_python_source_files(paths: List[Path]) -> List[Path]:
+    """Return all of the Python source files in the paths, which are directories or files."""
+    # import pyastgrep only when searching for source files so
+    # that the commands that do not search start more quickly
+    from pyastgrep import files as pyastgrepfiles  # type: ignore
+
+    # use the same directory walker as pyastgrep so that the files found
+    # here are the ones that pyastgrep would search, respecting the
+    # rules in .gitignore files and skipping any hidden files
+    return [
+        path
+        for path in pyastgrepfiles.get_files_to_search(paths)
+        if isinstance(path, Path)
+    ]
+
+
 def write_chasten_results(
     results_path: Path,
     projectname: str,
@@ -195,13 +237,12 @@ def write_chasten_results(
         # create the file and then write the text,
         # using indentation to ensure that JSON file is readable
         results_path_with_file = results_path / complete_results_file_name
-        results_json = results_content.model_dump_json(indent=2)
+        # serialize the results with the Rust-based serializer of Pydantic,
+        # directly creating the UTF-8 encoded bytes of the JSON contents
+        # instead of creating a string that must then be encoded again
+        results_json = chasten_results_adapter.dump_json(results_content, indent=2)
         # use the built-in method with pathlib Path to write the JSON contents
-        try:
-            results_path_with_file.write_text(results_json)
-        except:  # noqa: E722
-            results_path_with_file.write_text(results_json, "utf-8")
-
+        results_path_with_file.write_bytes(results_json)
         # return the name of the created file for diagnostic purposes
         return complete_results_file_name
     # saving was not enabled and thus this function cannot
@@ -210,7 +251,7 @@ def write_chasten_results(
 
 
 def write_dict_results(
-    results_json: str,
+    results_json: bytes,
     results_path: Path,
     projectname: str,
 ) -> str:
@@ -230,27 +271,30 @@ def write_dict_results(
     # create the file and then write the text,
     # using indentation to ensure that JSON file is readable
     results_path_with_file = results_path / complete_results_file_name
-    # use the built-in method from pathlib Path to write the JSON contents
-    results_path_with_file.write_text(results_json, "utf-8")
+    # use the built-in method from pathlib Path to write the JSON contents,
+    # which are already encoded as UTF-8 bytes
+    results_path_with_file.write_bytes(results_json)
     # return the name of the file that contains the JSON dictionary contents
     return complete_results_file_name
 
 
 def write_flattened_csv_and_database(
-    combined_results_json: str,
+    json_dicts: Iterable[Dict[Any, Any]],
     results_path: Path,
     projectname: str,
 ) -> str:
     """Write flattened CSV files with results to the specified directory and create the database."""
+    # import flatterer and the database module only when flattening
+    # results because they depend on pandas, which is slow to import
+    import flatterer  # type: ignore
+
+    from chasten import database
+
     # generate a unique hexadecimal code that will ensure that
     # this file name is unique when it is being saved
     results_file_uuid = uuid.uuid4().hex
     # create a formatted datetime
     formatted_datetime = str(datetime.now().strftime("%Y%m%d%H%M%S"))
-    # create a string-based name for the JSON file that contains
-    # the combined results, suitable for input to the flatten function
-    combined_results_json_file = results_path / Path(combined_results_json)
-    combined_results_json_file_str = str(combined_results_json_file)
     # create a final part of the directory name so that it includes:
     # a) the name of the project
     # b) the date on which analysis was completed
@@ -272,34 +316,188 @@ def write_flattened_csv_and_database(
     # perform the flattening, creating a directory called csv/ that
     # contains all of the CSV files and a SQLite3 database called chasten.db
     # that contains all of the contents of the CSV files; this chasten.db
-    # file is ready for browsing through the use of a tool like datasette
+    # file is ready for browsing through the use of a tool like datasette;
+    # note that flatterer receives the dictionaries, which may be produced
+    # one at a time, instead of parsing the JSON file that combines them
     flatterer.flatten(
-        combined_results_json_file_str,
+        json_dicts,
         flattened_output_directory_str,
         csv=True,
         sqlite=True,
         sqlite_path=database_file_name_str,
     )
-    # create a view that combines all of the data
-    database.create_chasten_view(database_file_name_str)
-    # enable full-text search in the SQLite3 database
-    database.enable_full_text_search(database_file_name_str)
+    # create a view that combines all of the data, enable full-text search,
+    # and index the links between tables in the SQLite3 database in one
+    # transaction after flatterer inserted all of the rows
+    database.configure_chasten_database(database_file_name_str)
     # return the name of the directory that contains the flattened CSV files
     return flattened_output_directory_str
 
 
+def read_integration_manifest(
+    manifest_path: Path,
+) -> Tuple[bool, Dict[str, List[Path]]]:
+    """Read a manifest that maps the name of each project to the paths of its JSON result files."""
+    # the manifest is a YAML (or JSON) file that maps each project's name
+    # to a path or a list of paths, like this:
+    # lazytracker:
+    #   - subject-data/lazytracker
+    # multicounter: subject-data/multicounter
+    (valid, manifest_data) = configuration.convert_configuration_text_to_yaml(
+        manifest_path.read_text("utf-8")
+    )
+    if not valid or not isinstance(manifest_data, dict) or not manifest_data:
+        return (False, {})
+    manifest: Dict[str, List[Path]] = {}
+    for project, project_paths in manifest_data.items():
+        # a project with a single path does not need to list it
+        project_path_list = (
+            [project_paths] if isinstance(project_paths, str) else project_paths
+        )
+        if not isinstance(project_path_list, list) or not all(
+            isinstance(project_path, str) for project_path in project_path_list
+        ):
+            return (False, {})
+        # a relative path is relative to the directory containing the manifest
+        # so that the manifest works from any current working directory
+        manifest[str(project)] = [
+            manifest_path.parent / project_path for project_path in project_path_list
+        ]
+        if not all(project_path.exists() for project_path in manifest[str(project)]):
+            return (False, {})
+    return (True, manifest)
+
+
+def find_json_results(json_paths: Iterable[Path]) -> List[Path]:
+    """Find the JSON result files, looking inside of each of the paths that is a directory."""
+    results_file_prefix = f"{constants.filesystem.Main_Results_File_Name}-"
+    results_file_suffix = f".{constants.filesystem.Results_Extension}"
+    found_json_paths = []
+    for json_path in json_paths:
+        # scan the entries of a directory so that the type of each entry comes
+        # from the directory listing instead of a separate stat of each file;
+        # note that a path that is not a directory is a JSON file to integrate
+        # and that a path that does not exist raises a FileNotFoundError
+        try:
+            with os.scandir(json_path) as directory_entries:
+                found_json_paths.extend(
+                    sorted(
+                        Path(directory_entry.path)
+                        for directory_entry in directory_entries
+                        if directory_entry.name.startswith(results_file_prefix)
+                        and directory_entry.name.endswith(results_file_suffix)
+                        and directory_entry.is_file(follow_symlinks=False)
+                    )
+                )
+        except NotADirectoryError:
+            found_json_paths.append(json_path)
+    return found_json_paths
+
+
+def load_json_file(json_path: Path) -> Dict[Any, Any]:
+    """Turn the contents of a JSON file into a dictionary."""
+    # parse the bytes of the file with orjson when it is available
+    # so that the file is not decoded into an intermediate string
+    if orjson is not None:
+        return orjson.loads(json_path.read_bytes())
+    return json.loads(json_path.read_text("utf-8"))
+
+
+def iterate_json_results(json_paths: Iterable[Path]) -> Iterator[Dict[Any, Any]]:
+    """Yield a dictionary with the contents of each JSON file path, one file at a time."""
+    for json_path in json_paths:
+        yield load_json_file(json_path)
+
+
 def get_json_results(json_paths: List[Path]) -> List[Dict[Any, Any]]:
     """Get a list of dictionaries, one the contents of each JSON file path."""
-    # create an empty list of dictionaries
-    json_dicts_list: List[Dict[Any, Any]] = []
-    # iterate through each of the provided paths to a JSON file
+    # there is only a single file and thus there are no reads to overlap
+    if len(json_paths) <= 1:
+        return [load_json_file(json_path) for json_path in json_paths]
+    # turn the contents of each of the JSON files into a dictionary, reading
+    # the files in separate threads so that waiting for one file to be read
+    # overlaps with reading and parsing the other files; note that the
+    # dictionaries are in the same order as the provided paths
+    max_workers = min(json_read_maximum_threads, len(json_paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load_json_file, json_paths))
+
+
+def create_integration_fingerprint(
+    json_paths: List[Path], keep_intermediate: bool = True
+) -> str:
+    """Create a fingerprint of the JSON files from their names, modification times, and sizes."""
+    fingerprint = hashlib.sha256()
+    # an integration that did not save the combined JSON file
+    # cannot be reused by one that must save the combined file
+    fingerprint.update(f"keep_intermediate:{keep_intermediate}\n".encode())
+    # a JSON file that is added, removed, renamed, or changed
+    # leads to a different fingerprint; note that this only needs
+    # the status of each file instead of all of its contents
     for json_path in json_paths:
-        # turn the contents of the current JSON file into a dictionary
-        json_dict = json.loads(json_path.read_text("utf-8"))
-        # add the current dictionary to the list of dictionaries
-        json_dicts_list.append(json_dict)
-    # return the list of JSON dictionaries
-    return json_dicts_list
+        json_path_stat = json_path.stat()
+        fingerprint.update(
+            f"{json_path.resolve()}:{json_path_stat.st_mtime_ns}:{json_path_stat.st_size}\n".encode()
+        )
+    return fingerprint.hexdigest()
+
+
+def get_integration_fingerprint_file(results_path: Path, projectname: str) -> Path:
+    """Return the file that stores the fingerprint of the last integration of a project."""
+    # the file is hidden and does not have the extension of a JSON file so that
+    # it is not mistaken for one of the files that result from an integration
+    return (
+        results_path
+        / f"{constants.chasten.Integrate_Fingerprint_File_Name}-{projectname}.{constants.chasten.Integrate_Fingerprint_Extension}"
+    )
+
+
+def get_integrated_directory(
+    results_path: Path, projectname: str, fingerprint: str
+) -> Union[Path, None]:
+    """Return the directory from an earlier integration of the same JSON files if its files still exist."""
+    fingerprint_file = get_integration_fingerprint_file(results_path, projectname)
+    # there was no earlier integration or its fingerprint cannot be read
+    try:
+        fingerprint_contents = json.loads(fingerprint_file.read_text("utf-8"))
+    except (OSError, ValueError):
+        return None
+    # the JSON files changed since the earlier integration
+    if fingerprint_contents.get("fingerprint") != fingerprint:
+        return None
+    # the database from the earlier integration no longer exists
+    integrated_directory = Path(fingerprint_contents.get("directory", ""))
+    if not (integrated_directory / constants.datasette.Chasten_Database).is_file():
+        return None
+    # the combined JSON file from the earlier integration no longer exists
+    combined_json_file_name = fingerprint_contents.get("combined_file", "")
+    if (
+        combined_json_file_name
+        and not (results_path / combined_json_file_name).is_file()
+    ):
+        return None
+    return integrated_directory
+
+
+def write_integration_fingerprint(
+    results_path: Path,
+    projectname: str,
+    fingerprint: str,
+    integrated_directory: str,
+    combined_json_file_name: str = "",
+) -> None:
+    """Write the fingerprint of the JSON files and the files that contain their integration."""
+    fingerprint_file = get_integration_fingerprint_file(results_path, projectname)
+    fingerprint_file.write_text(
+        json.dumps(
+            {
+                "fingerprint": fingerprint,
+                "directory": integrated_directory,
+                "combined_file": combined_json_file_name,
+            }
+        ),
+        "utf-8",
+    )
 
 
 def can_find_executable(executable_name: str) -> Tuple[bool, str]:
@@ -0,0 +1,67 @@
+"""Cache the status of paths in the filesystem for a short time."""
+
+import os
+import stat
+import time
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+# the number of seconds during which the cached status of a path is reused
+# before the filesystem is checked again, which bounds how stale it can be
+stat_cache_time_to_live = 2.0
+# the largest number of paths with a cached status
+stat_cache_maximum_size = 8192
+
+# map the name of each path to the time at which its status was
+# checked and its status, which is None when the path does not exist
+_stat_cache: Dict[str, Tuple[float, Union[os.stat_result, None]]] = {}
+
+
+def _cached_stat(path_name: str) -> Union[os.stat_result, None]:
+    """Return the status of a path or None when the path does not exist."""
+    current_time = time.monotonic()
+    # reuse the status of the path when it was checked recently; note that a
+    # path that does not exist is also cached so that checking it again does
+    # not require another system call
+    cached_entry = _stat_cache.get(path_name)
+    if (
+        cached_entry is not None
+        and current_time - cached_entry[0] < stat_cache_time_to_live
+    ):
+        return cached_entry[1]
+    try:
+        path_stat: Union[os.stat_result, None] = os.stat(path_name)
+    except (OSError, ValueError):
+        path_stat = None
+    # forget all of the paths instead of growing the cache without bound
+    if len(_stat_cache) >= stat_cache_maximum_size:
+        _stat_cache.clear()
+    _stat_cache[path_name] = (current_time, path_stat)
+    return path_stat
+
+
+def cached_exists(path: Union[str, Path]) -> bool:
+    """Determine whether or not a path exists."""
+    return _cached_stat(os.fspath(path)) is not None
+
+
+def cached_isfile(path: Union[str, Path]) -> bool:
+    """Determine whether or not a path exists and is a file."""
+    path_stat = _cached_stat(os.fspath(path))
+    return path_stat is not None and stat.S_ISREG(path_stat.st_mode)
+
+
+def cached_isdir(path: Union[str, Path]) -> bool:
+    """Determine whether or not a path exists and is a directory."""
+    path_stat = _cached_stat(os.fspath(path))
+    return path_stat is not None and stat.S_ISDIR(path_stat.st_mode)
+
+
+def invalidate(path: Union[str, Path]) -> None:
+    """Forget the cached status of a path after it was created or changed."""
+    _stat_cache.pop(os.fspath(path), None)
+
+
+def clear() -> None:
+    """Forget the cached status of all of the paths."""
+    _stat_cache.clear()
@@ -1,39 +1,41 @@
 """💫 Chasten checks the AST of a Python program."""
 
+import array
 import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 import typer
-from pyastgrep import search as pyastgrepsearch  # type: ignore
 
 from chasten import (
     checks,
-    configApp,
     configuration,
     constants,
-    createchecks,
-    database,
     debug,
     enumerations,
     filesystem,
+    filesystem_cache,
     output,
-    process,
     results,
-    server,
     util,
 )
 
 # create a Typer object to support the command-line interface
 cli = typer.Typer(no_args_is_help=True)
-app = configApp.config_App()
 # create a small bullet for display in the output
 small_bullet_unicode = constants.markers.Small_Bullet_Unicode
 CHECK_STORAGE = constants.chasten.App_Storage
 API_KEY_STORAGE = constants.chasten.API_Key_Storage
 ANALYSIS_FILE = constants.chasten.Analyze_Storage
+# map the status of a check to its symbol for display and its word for markdown
+CHECK_STATUS_TABLE = {
+    True: (util.get_symbol_boolean(True), "PASSED:"),
+    False: (util.get_symbol_boolean(False), "FAILED:"),
+}
 
 
 # ---
@@ -51,8 +53,8 @@ def output_preamble(
     # setup the console and the logger through the output module
     output.setup(debug_level, debug_destination)
     output.logger.debug(f"Display verbose output? {verbose}")
-    output.logger.debug(f"Debug level? {debug_level.value}")
-    output.logger.debug(f"Debug destination? {debug_destination.value}")
+    output.logger.debug(f"Debug level? {debug_level}")
+    output.logger.debug(f"Debug destination? {debug_destination}")
     # display the header
     output.print_header()
     # display details about configuration as
@@ -62,35 +64,102 @@ def output_preamble(
     # arguments that were input to the function
     output.print_diagnostics(
         verbose,
-        debug_level=debug_level.value,
-        debug_destination=debug_destination.value,
+        debug_level=debug_level,
+        debug_destination=debug_destination,
         **kwargs,
     )
 
 
-def display_serve_or_publish_details(
+def display_serve_or_publish_details(  # noqa: PLR0913
     label: str,
     database_path: Path,
     metadata: Path,
     port: int = 8001,
     publish: bool = False,
+    batch_console: Union[output.BatchConsole, None] = None,
 ) -> None:
     """Display diagnostic details at startup of serve or publish commands."""
+    # collect the lines and display them at once, unless the
+    # lines are part of a larger batch that is displayed later
+    details_console = output.BatchConsole() if batch_console is None else batch_console
     # output diagnostic information about the datasette instance
-    output.console.print()
-    output.console.print(label)
-    output.console.print(
+    details_console.print()
+    details_console.print(label)
+    details_console.print(
         f"{constants.markers.Indent}{small_bullet_unicode} Database: '{output.shorten_file_name(str(database_path), 120)}'"
     )
-    output.console.print(
+    details_console.print(
         f"{constants.markers.Indent}{small_bullet_unicode} Metadata: '{output.shorten_file_name(str(metadata), 120)}'"
     )
     # do not display a port if the task is publishing to fly.io
     # because that step does not support port specification
     if not publish:
-        output.console.print(
+        details_console.print(
             f"{constants.markers.Indent}{small_bullet_unicode} Port: {port}"
         )
+    if batch_console is None:
+        details_console.flush()
+
+
+def integrate_project(
+    project: str,
+    json_path: List[Path],
+    output_directory: Path,
+    force: bool = False,
+    keep_intermediate: bool = True,
+) -> Tuple[str, str, str]:
+    """Integrate the JSON files of a project, returning the reused directory, the combined file, and the new directory."""
+    # create a fingerprint of the JSON files so that integrating the same,
+    # unchanged files again reuses the results of the earlier integration
+    # instead of combining and flattening all of the files again
+    fingerprint = filesystem.create_integration_fingerprint(
+        json_path, keep_intermediate
+    )
+    if not force:
+        integrated_directory = filesystem.get_integrated_directory(
+            output_directory, project, fingerprint
+        )
+        if integrated_directory is not None:
+            return (str(integrated_directory), "", "")
+    # extract the JSON dictionaries from the specified files one at a time
+    # as they are flattened so that only one of them is in memory at once
+    json_dicts: Iterable[Dict[Any, Any]] = filesystem.iterate_json_results(json_path)
+    combined_json_file_name = ""
+    # save the JSON file that combines all of the results if it is requested
+    if keep_intermediate:
+        # extract all of the JSON dictionaries from the specified files
+        # since they are all needed to create the combined JSON file
+        json_dicts = filesystem.get_json_results(json_path)
+        # combine all of the dictionaries into a single JSON file; note that
+        # the process module is only imported when it is needed
+        from chasten import process
+
+        combined_json_dict = process.combine_dicts(json_dicts)
+        # write the combined JSON file contents to the filesystem
+        combined_json_file_name = filesystem.write_dict_results(
+            combined_json_dict, output_directory, project
+        )
+        output.logger.debug(f"Saved the file '{combined_json_file_name}'.")
+    # "flatten" (i.e., "un-nest") the dictionaries using flatterer, create
+    # the SQLite3 database, and then configure the database for use in datasette;
+    # note that this uses the dictionaries instead of reading the combined
+    # JSON file so that the results are not parsed a second time
+    combined_flattened_directory = filesystem.write_flattened_csv_and_database(
+        json_dicts,
+        output_directory,
+        project,
+    )
+    output.logger.debug("Flattened JSON and created SQLite database.")
+    # record the fingerprint of the JSON files and the files that
+    # now contain their integration for the next run of this command
+    filesystem.write_integration_fingerprint(
+        output_directory,
+        project,
+        fingerprint,
+        combined_flattened_directory,
+        combined_json_file_name,
+    )
+    return ("", combined_json_file_name, combined_flattened_directory)
 
 
 # ---
@@ -107,7 +176,12 @@ def create_checks(
     filename: Path = typer.Option("checks.yml", help="YAML file name")
 ) -> None:
     """🔧 Interactively specify for checks and have a checks.yml file created(Requires API key)"""
+    # import the textual application and the openai client only when this
+    # command runs since importing them slows the start of every command
+    from chasten import configApp, createchecks
+
     # creates a textual object for better user interface
+    app = configApp.config_App()
     app.run()
     # Checks if the file storing the wanted checks exists and is valid
     if filesystem.confirm_valid_file(CHECK_STORAGE):
@@ -191,8 +265,8 @@ def configure(  # noqa: PLR0913
     # setup the console and the logger through the output module
     output.setup(debug_level, debug_destination)
     output.logger.debug(f"Display verbose output? {verbose}")
-    output.logger.debug(f"Debug level? {debug_level.value}")
-    output.logger.debug(f"Debug destination? {debug_destination.value}")
+    output.logger.debug(f"Debug level? {debug_level}")
+    output.logger.debug(f"Debug destination? {debug_destination}")
     # display the configuration directory and its contents
     if task == enumerations.ConfigureTask.VALIDATE:
         # validate the configuration files:
@@ -325,13 +399,22 @@ def analyze(  # noqa:  PLR0912, PLR0913, PLR0915
     verbose: bool = typer.Option(False, help="Enable verbose mode output."),
     save: bool = typer.Option(False, help="Enable saving of output file(s)."),
     force: bool = typer.Option(False, help="Force creation of new markdown file"),
+    clear_ast_cache: bool = typer.Option(
+        False, help="Remove the cached ASTs of source files before analysis."
+    ),
 ) -> None:
     """💫 Analyze the AST of Python source code."""
+    # import the modules that search the AST and display results only when
+    # they are needed so that the other commands start more quickly
+    from pyastgrep import search as pyastgrepsearch  # type: ignore
+
+    from chasten import astcache, database, process
+
     # setup the console and the logger through the output module
     output.setup(debug_level, debug_destination)
     output.logger.debug(f"Display verbose output? {verbose}")
-    output.logger.debug(f"Debug level? {debug_level.value}")
-    output.logger.debug(f"Debug destination? {debug_destination.value}")
+    output.logger.debug(f"Debug level? {debug_level}")
+    output.logger.debug(f"Debug destination? {debug_destination}")
     start_time = time.time()
     output.logger.debug("Analysis Started.")
     # output the preamble, including extra parameters specific to this function
@@ -393,48 +476,48 @@ def analyze(  # noqa:  PLR0912, PLR0913, PLR0915
     ]
     # filter the list of checks based on the include and exclude parameters
     # --> only run those checks that were included
-    check_list = process.include_or_exclude_checks(  # type: ignore
-        check_list, include=True, *check_include
-    )
     # --> remove those checks that were excluded
-    check_list = process.include_or_exclude_checks(  # type: ignore
-        check_list, include=False, *check_exclude
+    check_list = process.filter_checks(  # type: ignore
+        check_list, check_include, check_exclude
     )
     # the specified search path is not valid and thus it is
     # not possible to analyze the Python source files in this directory
     # OR
     # the specified search path is not valid and thus it is
     # not possible to analyze the specific Python source code file
-    if not filesystem.confirm_valid_directory(
+    if not filesystem_cache.cached_isdir(
         input_path
-    ) and not filesystem.confirm_valid_file(input_path):
+    ) and not filesystem_cache.cached_isfile(input_path):
         output.console.print(
             "\n:person_shrugging: Cannot perform analysis due to invalid search directory.\n"
         )
         sys.exit(constants.markers.Non_Zero_Exit)
     if store_result:
-        # creates an empty string for storing results temporarily
-        analysis_result = ""
+        # creates an empty list for storing the parts of the results temporarily;
+        # note that these parts are joined together when writing the file
+        analysis_chunks: List[str] = []
         analysis_file_dir = store_result / ANALYSIS_FILE
-        # clears markdown file of results if it exists and new results are to be store
-        if filesystem.confirm_valid_file(analysis_file_dir):
-            if not force:
-                if display:
-                    database.display_results_frog_mouth(
-                        analysis_file_dir, util.get_OS()
-                    )
-                    sys.exit(0)
-                else:
-                    output.console.print(
-                        "File already exists: use --force to recreate markdown directory."
-                    )
-                    sys.exit(constants.markers.Non_Zero_Exit)
+        # determine the absolute path of the markdown file a single time
+        # so that it is available when displaying where results were saved
+        analysis_file_abs = os.path.abspath(analysis_file_dir)
+        # the markdown file of results already exists and thus it is only
+        # replaced when forced; note that the file is written a single time
+        # after the analysis, creating it or replacing its contents
+        if filesystem_cache.cached_isfile(analysis_file_dir) and not force:
+            if display:
+                database.display_results_frog_mouth(analysis_file_dir, util.get_OS())
+                sys.exit(0)
             else:
-                analysis_file_dir.write_text("")
-        # creates file if doesn't exist already
-        analysis_file_dir.touch()
+                output.console.print(
+                    "File already exists: use --force to recreate markdown directory."
+                )
+                sys.exit(constants.markers.Non_Zero_Exit)
     # create the list of directories
     valid_directories = [input_path]
+    # find all of the Python source files in the directories a single time
+    # so that every check searches the same files; note that each file is
+    # parsed once and then the parse is reused for all of the checks
+    source_files = filesystem.get_python_source_files(valid_directories)
     # output the list of directories subject to checking
     output.console.print()
     output.console.print(f":sparkles: Analyzing Python source code in: {input_path}")
@@ -443,141 +526,117 @@ def analyze(  # noqa:  PLR0912, PLR0913, PLR0915
     output.console.print(f":tada: Performing {len(check_list)} check(s):")
     output.console.print()
     # create a check_status list for all of the checks
-    check_status_list: List[bool] = []
+    # note that the array stores each status as a small integer
+    check_status_list = array.array("b")
     # check XPATH version
     if xpath == "1.0":
         output.logger.debug("Using XPath version 1.0")
+        use_xpath2 = False
     else:
         output.logger.debug("Using XPath version 2.0")
+        use_xpath2 = True
+    # extract the details about each of the checks a single time
+    # so that they are available while performing the checks
+    check_specs = [
+        checks.create_check_spec(current_check) for current_check in check_list
+    ]
+    # search the XML contents of the AST for each of the Python source files
+    # with the pattern (i.e., the XPATH expression) for every check; note that
+    # each pattern is compiled a single time, each file is searched for all
+    # of the patterns at once, and many files may be searched in parallel;
+    # this looks for matches across all path(s) in the specified source path
+    if clear_ast_cache:
+        astcache.prune(maximum_size=0)
+    check_matches_list = process.search_python_files(
+        source_files, [spec.pattern for spec in check_specs], use_xpath2
+    )
+    # keep the cache of ASTs from growing without bound by removing
+    # the cached ASTs that were used the longest time ago
+    astcache.prune()
     # iterate through and perform each of the checks
-    for current_check in check_list:
-        # extract the pattern for the current check
-        current_xpath_pattern = str(
-            current_check[constants.checks.Check_Pattern]
-        )  # type: ignore
-        # extract the minimum and maximum values for the checks, if they exist
-        # note that this function will return None for a min or a max if
-        # that attribute does not exist inside of the current_check; importantly,
-        # having a count or a min or a max is all optional in a checks file
-        (min_count, max_count) = checks.extract_min_max(current_check)
-        # extract details about the check to display in the header
-        # of the syntax box for this specific check
-        check_id = current_check[constants.checks.Check_Id]  # type: ignore
-        output.logger.debug(f"check id: {check_id}")
-        check_name = current_check[constants.checks.Check_Name]  # type: ignore
-        check_description = checks.extract_description(current_check)
-        # search for the XML contents of an AST that match the provided
-        # XPATH query using the search_python_file in search module of pyastgrep;
-        # this looks for matches across all path(s) in the specified source path
-        # match_generator = pyastgrepsearch.search_python_files(
-        #         paths=valid_directories, expression=current_xpath_pattern, xpath2=True
-        # )
-        if xpath == "1.0":
-            match_generator = pyastgrepsearch.search_python_files(
-                paths=valid_directories, expression=current_xpath_pattern, xpath2=False
-            )
-        else:
-            match_generator = pyastgrepsearch.search_python_files(
-                paths=valid_directories, expression=current_xpath_pattern, xpath2=True
-            )
-        # materia>>> mastlize a list from the generator of (potential) matches;
-        # note that this list will also contain an object that will
-        # indicate that the analysis completed for each located file
-        match_generator_list = list(match_generator)
-        # filter the list of matches so that it only includes
-        # those that are a Match object that will contain source code
-        (match_generator_list, _) = process.filter_matches(
-            match_generator_list, pyastgrepsearch.Match
-        )
-        # organize the matches according to the file to which they
-        # correspond so that processing of matches takes place per-file
-        match_dict = process.organize_matches(match_generator_list)
-        # perform an enforceable check if it is warranted for this check
-        current_check_save = None
-        if checks.is_checkable(min_count, max_count):
-            # determine whether or not the number of found matches is within mix and max
-            check_status = checks.check_match_count(
-                len(match_generator_list), min_count, max_count
-            )
-            # keep track of the outcome for this check
-            check_status_list.append(check_status)
-        # this is not an enforceable check and thus the tool always
-        # records that the checked passed as a default
-        else:
-            check_status = True
-        # convert the status of the check to a visible symbol for display
-        check_status_symbol = util.get_symbol_boolean(check_status)
-        # escape the open bracket symbol that may be in an XPATH expression
-        # and will prevent it from displaying correctly
-        current_xpath_pattern_escape = current_xpath_pattern.replace("[", "\\[")
-        # display minimal diagnostic output
-        output.console.print(
-            f"  {check_status_symbol} id: '{check_id}', name: '{check_name}'"
-            + f", pattern: '{current_xpath_pattern_escape}', min={min_count}, max={max_count}"
-        )
-        if store_result:
-            # makes the check marks or x's appear as words instead for markdown
-            check_pass = (
-                "PASSED:"
-                if check_status_symbol == "[green]\u2713[/green]"
-                else "FAILED:"
-            )
-            # stores check type in a string to stored in file later
-            analysis_result += (
-                f"\n# {check_pass} **ID:** '{check_id}', **Name:** '{check_name}'"
-                + f", **Pattern:** '{current_xpath_pattern_escape}', min={min_count}, max={max_count}\n\n"
-            )
-
-        # for each potential match, log and, if verbose model is enabled,
-        # display details about each of the matches
-        current_result_source = results.Source(
-            filename=str(str(vd) for vd in valid_directories)
-        )
-        # there were no matches and thus the current_check_save of None
-        # should be recorded inside of the source of the results
-        if len(match_generator_list) == 0:
-            current_result_source.check = current_check_save
-        # iteratively analyze:
-        # a) A specific file name
-        # b) All of the matches for that file name
-        # Note: the goal is to only process matches for a
-        # specific file, ensuring that matches for different files
-        # are not mixed together, which would contaminate the results
-        # Note: this is needed because using pyastgrepsearch will
-        # return results for all of the files that matched the check
-        for file_name, matches_list in match_dict.items():
-            # create the current check
-            current_check_save = results.Check(
-                id=check_id,  # type: ignore
-                name=check_name,  # type: ignore
-                description=check_description,  # type: ignore
-                min=min_count,  # type: ignore
-                max=max_count,  # type: ignore
-                pattern=current_xpath_pattern,
-                passed=check_status,
+    # collect the output for each check and display it after the check
+    # is complete instead of displaying each line as it is created
+    with output.BatchConsole() as batch_console:
+        for spec, check_matches in zip(check_specs, check_matches_list):
+            output.logger.debug(f"check id: {spec.id}")
+            # filter the (potential) matches so that there are only those that are
+            # a Match object that will contain source code and then organize the
+            # matches according to the file to which they correspond so that
+            # processing of matches takes place per-file; note that this takes
+            # place in a single pass that also counts the number of matches
+            (match_dict, total_matches) = process.stream_organize_matches(
+                check_matches, pyastgrepsearch.Match
             )
-            # create a source that is solely for this file name
-            current_result_source = results.Source(filename=file_name)
-            # put the current check into the list of checks in the current source
-            current_result_source.check = current_check_save
+            # perform an enforceable check if it is warranted for this check
+            if checks.is_checkable(spec.min, spec.max):
+                # determine whether or not the number of found matches is within mix and max
+                check_status = checks.check_match_count(
+                    total_matches, spec.min, spec.max
+                )
+                # keep track of the outcome for this check
+                check_status_list.append(check_status)
+            # this is not an enforceable check and thus the tool always
+            # records that the checked passed as a default
+            else:
+                check_status = True
+            # convert the status of the check to a visible symbol for display
+            # and to a word that describes the status in the markdown file
+            (check_status_symbol, check_pass) = CHECK_STATUS_TABLE[check_status]
             # display minimal diagnostic output
-            output.console.print(
-                f"    {small_bullet_unicode} {file_name} - {len(matches_list)} matches"
+            batch_console.print(
+                f"  {check_status_symbol} id: '{spec.id}', name: '{spec.name}'"
+                + f", pattern: '{spec.pattern_escaped}', min={spec.min}, max={spec.max}"
             )
             if store_result:
-                # stores details of checks in string to be stored later
-                analysis_result += f"    - {file_name} - {len(matches_list)} matches\n"
-            # extract the lines of source code for this file; note that all of
-            # these matches are organized for the same file and thus it is
-            # acceptable to extract the lines of the file from the first match
-            # a long as there are matches available for analysis
-            if len(matches_list) > 0:
-                current_result_source._filelines = matches_list[0].file_lines
-            # iterate through all of the matches that are specifically
-            # connected to this source that is connected to a specific file name
-            for current_match in matches_list:
-                if isinstance(current_match, pyastgrepsearch.Match):
-                    current_result_source._filelines = current_match.file_lines
+                # stores check type in a string to stored in file later
+                analysis_chunks.append(
+                    f"\n# {check_pass} **ID:** '{spec.id}', **Name:** '{spec.name}'"
+                    + f", **Pattern:** '{spec.pattern_escaped}', min={spec.min}, max={spec.max}\n\n"
+                )
+
+            # iteratively analyze:
+            # a) A specific file name
+            # b) All of the matches for that file name
+            # Note: the goal is to only process matches for a
+            # specific file, ensuring that matches for different files
+            # are not mixed together, which would contaminate the results
+            # Note: this is needed because using pyastgrepsearch will
+            # return results for all of the files that matched the check
+            for file_name, matches_list in match_dict.items():
+                # create the current check
+                current_check_save = results.Check(
+                    id=spec.id,
+                    name=spec.name,
+                    description=spec.description,
+                    min=spec.min,
+                    max=spec.max,
+                    pattern=spec.pattern,
+                    passed=check_status,
+                )
+                # create a source that is solely for this file name
+                current_result_source = results.Source(filename=file_name)
+                # put the current check into the list of checks in the current source
+                current_result_source.check = current_check_save
+                # display minimal diagnostic output
+                batch_console.print(
+                    f"    {small_bullet_unicode} {file_name} - {len(matches_list)} matches"
+                )
+                if store_result:
+                    # stores details of checks in string to be stored later
+                    analysis_chunks.append(
+                        f"    - {file_name} - {len(matches_list)} matches\n"
+                    )
+                # extract the lines of source code for this file; note that all of
+                # these matches are organized for the same file and thus it is
+                # acceptable to extract the lines of the file from the first match;
+                # note also that every file in the dictionary has at least one match
+                file_lines = matches_list[0].file_lines
+                current_result_source._filelines = file_lines
+                # iterate through all of the matches that are specifically
+                # connected to this source that is connected to a specific file name;
+                # note that these are all instances of pyastgrepsearch.Match because
+                # the organization of the matches already filtered out other objects
+                for current_match in matches_list:
                     # extract the direct line number for this match
                     position_end = current_match.position.lineno
                     # extract the column offset for this match
@@ -591,11 +650,11 @@ def analyze(  # noqa:  PLR0912, PLR0913, PLR0915
                     current_match_for_current_check_save = results.Match(
                         lineno=position_end,
                         coloffset=column_offset,
-                        linematch=current_match.file_lines[position_end - 1].lstrip(
+                        linematch=file_lines[position_end - 1].lstrip(
                             constants.markers.Space
                         ),
                         linematch_context=util.join_and_preserve(
-                            current_match.file_lines,
+                            file_lines,
                             max(
                                 0,
                                 position_end - constants.markers.Code_Context,
@@ -610,16 +669,24 @@ def analyze(  # noqa:  PLR0912, PLR0913, PLR0915
                     current_check_save.matches.append(
                         current_match_for_current_check_save
                     )  # type: ignore
-            # add the current source to main object that contains a list of source
-            chasten_results_save.sources.append(current_result_source)
-        # add the amount of total matches in each check to the end of each checks output
-        output.console.print(f"   = {len(match_generator_list)} total matches\n")
+                # add the current source to main object that contains a list of source
+                chasten_results_save.sources.append(current_result_source)
+            # add the amount of total matches in each check to the end of each checks output
+            batch_console.print(f"   = {total_matches} total matches\n")
+            # display all of the output for this check at once
+            batch_console.flush()
     # calculate the final count of matches found
     total_result = util.total_amount_passed(check_status_list)
     # display checks passed, total amount of checks, and percentage of checks passed
     output.console.print(
         f":computer: {total_result[0]} / {total_result[1]} checks passed ({total_result[2]}%)\n"
     )
+    # display how many of the source files were parsed in an earlier run of chasten
+    (cache_hits, cache_misses) = astcache.get_statistics()
+    output.opt_print_log(
+        verbose,
+        cache=f":floppy_disk: Reused {cache_hits} cached AST(s) and parsed {cache_misses} source file(s)\n",
+    )
     # display all of the analysis results if verbose output is requested
     output.print_analysis_details(chasten_results_save, verbose=verbose)
     # save all of the results from this analysis
@@ -634,14 +701,16 @@ def analyze(  # noqa:  PLR0912, PLR0913, PLR0915
     all_checks_passed = all(check_status_list)
     end_time = time.time()
     elapsed_time = end_time - start_time
+    # writes results of analyze into a markdown file with a single write
+    if store_result:
+        analysis_file_dir.write_text("".join(analysis_chunks), encoding="utf-8")
+        filesystem_cache.invalidate(analysis_file_dir)
 
     if not all_checks_passed:
         output.console.print(":sweat: At least one check did not pass.")
         if store_result:
-            # writes results of analyze into a markdown file
-            analysis_file_dir.write_text(analysis_result, encoding="utf-8")
             output.console.print(
-                f"\n:sparkles: Results saved in: {os.path.abspath(analysis_file_dir)}\n"
+                f"\n:sparkles: Results saved in: {analysis_file_abs}\n"
             )
         sys.exit(constants.markers.Non_Zero_Exit)
     output.console.print(
@@ -649,12 +718,9 @@ def analyze(  # noqa:  PLR0912, PLR0913, PLR0915
     )
     output.logger.debug("Analysis complete.")
     if store_result:
-        # writes results of analyze into a markdown file
-        result_path = os.path.abspath(analysis_file_dir)
-        analysis_file_dir.write_text(analysis_result, encoding="utf-8")
-        output.console.print(f"\n:sparkles: Results saved in: {result_path}\n")
+        output.console.print(f"\n:sparkles: Results saved in: {analysis_file_abs}\n")
         if display:
-            database.display_results_frog_mouth(result_path, util.get_OS())
+            database.display_results_frog_mouth(analysis_file_abs, util.get_OS())
 
 
 @cli.command()
@@ -691,6 +757,10 @@ def integrate(  # noqa: PLR0913
         False,
         help="Create converted results files even if they exist",
     ),
+    keep_intermediate: bool = typer.Option(
+        True,
+        help="Save the JSON file that combines all of the results",
+    ),
     verbose: bool = typer.Option(False, help="Display verbose debugging output"),
 ) -> None:
     """🚧 Integrate files and make a database."""
@@ -703,37 +773,59 @@ def integrate(  # noqa: PLR0913
         output_directory=output_directory,
         json_path=json_path,
         force=force,
+        keep_intermediate=keep_intermediate,
     )
     output.logger.debug("Integrate function started.")
-    # output the list of directories subject to checking
-    output.console.print()
-    output.console.print(":sparkles: Combining data file(s) in:")
-    output.logger.debug(":sparkles: Combining data file(s) in:")
-    output.console.print()
-    output.print_list_contents(json_path)
-    # extract all of the JSON dictionaries from the specified files
-    json_dicts = filesystem.get_json_results(json_path)
-    count = len(json_path)
-    output.console.print(f"\n:sparkles: Total of {count} files in all directories.")
-    # combine all of the dictionaries into a single string
-    combined_json_dict = process.combine_dicts(json_dicts)
-    # write the combined JSON file string to the filesystem
-    combined_json_file_name = filesystem.write_dict_results(
-        combined_json_dict, output_directory, project
+    # find the JSON result files in the directories and store the paths in a
+    # list a single time so that displaying, counting, fingerprinting, and
+    # reading the files all use the same sequence of paths
+    try:
+        json_path = filesystem.find_json_results(json_path)
+    except FileNotFoundError as error:
+        output.console.print(
+            f"\n:person_shrugging: Cannot integrate the path '{error.filename}' that does not exist.\n"
+        )
+        output.logger.debug("Integrate function stopped with a missing path.")
+        sys.exit(constants.markers.Non_Zero_Exit)
+    # there is nothing to integrate when the paths do not contain any JSON files
+    # and thus the flattened directory and the database are not created
+    if not json_path:
+        output.console.print(
+            "\n:person_shrugging: Cannot integrate because there are no JSON result files in the path(s).\n"
+        )
+        output.logger.debug("Integrate function stopped without JSON files.")
+        sys.exit(constants.markers.Non_Zero_Exit)
+    # output the list of directories subject to checking and the count
+    # of the files with a single print to the console
+    with output.BatchConsole() as batch_console:
+        batch_console.print()
+        batch_console.print(":sparkles: Combining data file(s) in:")
+        output.logger.debug(":sparkles: Combining data file(s) in:")
+        batch_console.print()
+        output.print_list_contents(json_path, batch_console)
+        count = len(json_path)
+        batch_console.print()
+        batch_console.print(f":sparkles: Total of {count} files in all directories.")
+    # combine the JSON files and create the CSV files and the database unless
+    # these unchanged JSON files were already integrated by an earlier run
+    (
+        integrated_directory,
+        combined_json_file_name,
+        combined_flattened_directory,
+    ) = integrate_project(
+        project, json_path, output_directory, force, keep_intermediate
     )
+    if integrated_directory:
+        output.console.print(
+            f"\n:sparkles: Already integrated these file(s) in: {integrated_directory}"
+        )
+        output.console.print("Use --force to integrate them again.")
+        output.logger.debug("Integrate function skipped unchanged files.")
+        return
     # output the name of the saved file if saving successfully took place
     if combined_json_file_name:
         output.console.print(f"\n:sparkles: Saved the file '{combined_json_file_name}'")
-        output.logger.debug(f"Saved the file '{combined_json_file_name}'.")
-    # "flatten" (i.e., "un-nest") the now-saved combined JSON file using flatterer
-    # create the SQLite3 database and then configure the database for use in datasette
-    combined_flattened_directory = filesystem.write_flattened_csv_and_database(
-        combined_json_file_name,
-        output_directory,
-        project,
-    )
-    output.logger.debug("Flattened JSON and created SQLite database.")
-    # output the name of the saved file if saving successfully took place
+    # output the created directory structure if flattening took place
     if combined_flattened_directory:
         output.console.print(
             f"\n:sparkles: Created this directory structure in {Path(combined_flattened_directory).parent}:"
@@ -746,6 +838,150 @@ def integrate(  # noqa: PLR0913
         output.logger.debug("Integrate function completed successfully.")
 
 
+@cli.command()
+def integrate_all(  # noqa: PLR0913
+    manifest_path: Path = typer.Argument(
+        help="YAML manifest mapping each project's name to its JSON result file(s).",
+        exists=True,
+        file_okay=True,
+        dir_okay=False,
+        readable=True,
+        resolve_path=True,
+    ),
+    output_directory: Path = typer.Option(
+        ...,
+        "--save-directory",
+        "-s",
+        help="A directory for saving converted file(s).",
+        exists=True,
+        file_okay=False,
+        dir_okay=True,
+        readable=True,
+        writable=True,
+        resolve_path=True,
+    ),
+    debug_level: debug.DebugLevel = typer.Option(
+        debug.DebugLevel.ERROR.value,
+        "--debug-level",
+        "-l",
+        help="Specify the level of debugging output.",
+    ),
+    debug_destination: debug.DebugDestination = typer.Option(
+        debug.DebugDestination.CONSOLE.value,
+        "--debug-dest",
+        "-t",
+        help="Specify the destination for debugging output.",
+    ),
+    force: bool = typer.Option(
+        False,
+        help="Create converted results files even if they exist",
+    ),
+    keep_intermediate: bool = typer.Option(
+        True,
+        help="Save the JSON file that combines all of the results",
+    ),
+    verbose: bool = typer.Option(False, help="Display verbose debugging output"),
+) -> None:
+    """🏗️  Integrate the files of many projects and make a database for each."""
+    # output the preamble, including extra parameters specific to this function
+    output_preamble(
+        verbose,
+        debug_level,
+        debug_destination,
+        manifest_path=manifest_path,
+        output_directory=output_directory,
+        force=force,
+        keep_intermediate=keep_intermediate,
+    )
+    output.logger.debug("Integrate all function started.")
+    # read the projects and the paths of their JSON files from the manifest
+    (valid, manifest) = filesystem.read_integration_manifest(manifest_path)
+    if not valid:
+        output.console.print(
+            f"\n:person_shrugging: Cannot integrate with the invalid manifest '{manifest_path}'\n"
+        )
+        output.logger.debug("Integrate all function stopped with invalid manifest.")
+        sys.exit(constants.markers.Non_Zero_Exit)
+    # find the JSON result files of each project; note that a project without
+    # any JSON result files is reported instead of being integrated since
+    # there are no results with which to create its database
+    projects_json_paths = {
+        project: filesystem.find_json_results(manifest[project]) for project in manifest
+    }
+    projects = [project for project in manifest if projects_json_paths[project]]
+    output.console.print(
+        f"\n:sparkles: Integrating {len(projects)} project(s) listed in: {manifest_path}"
+    )
+    integration_results: Dict[str, Union[Tuple[str, str, str], Exception]] = {}
+    # each project has its own combined file, CSV files, and database and thus
+    # the projects are integrated at the same time in separate processes;
+    # note that a failure to integrate one of the projects is recorded so
+    # that it does not stop the integration of the other projects
+    integrate_function = partial(
+        integrate_project,
+        output_directory=output_directory,
+        force=force,
+        keep_intermediate=keep_intermediate,
+    )
+    maximum_workers = min(len(projects), os.cpu_count() or 1)
+    if maximum_workers > 1:
+        with ProcessPoolExecutor(max_workers=maximum_workers) as executor:
+            integration_futures = {
+                project: executor.submit(
+                    integrate_function, project, projects_json_paths[project]
+                )
+                for project in projects
+            }
+            for project, integration_future in integration_futures.items():
+                try:
+                    integration_results[project] = integration_future.result()
+                except Exception as error:
+                    integration_results[project] = error
+    else:
+        for project in projects:
+            try:
+                integration_results[project] = integrate_function(
+                    project, projects_json_paths[project]
+                )
+            except Exception as error:
+                integration_results[project] = error
+    # output the outcome of the integration for each of the projects
+    failed_count = 0
+    with output.BatchConsole() as batch_console:
+        for project, project_json_paths in projects_json_paths.items():
+            batch_console.print()
+            integration_result = integration_results.get(project)
+            if integration_result is None:
+                failed_count += 1
+                batch_console.print(
+                    f":person_shrugging: Cannot integrate '{project}' because there are no JSON result files in its path(s)."
+                )
+            elif isinstance(integration_result, Exception):
+                failed_count += 1
+                batch_console.print(
+                    f":person_shrugging: Cannot integrate '{project}' due to an error: {integration_result}"
+                )
+                output.logger.debug(
+                    f"Integrating '{project}' failed: {integration_result!r}"
+                )
+            elif integration_result[0]:
+                batch_console.print(
+                    f":sparkles: Already integrated the {len(project_json_paths)} file(s) of '{project}' in: {integration_result[0]}"
+                )
+            else:
+                batch_console.print(
+                    f":sparkles: Integrated the {len(project_json_paths)} file(s) of '{project}' in: {integration_result[2]}"
+                )
+    # indicate that integrating at least one of the projects failed
+    if failed_count:
+        output.console.print(
+            f"\n:person_shrugging: Could not integrate {failed_count} of {len(projects_json_paths)} project(s).\n"
+        )
+        output.logger.debug("Integrate all function completed with failures.")
+        sys.exit(constants.markers.Non_Zero_Exit)
+    output.logger.debug("Integrate all function completed successfully.")
+
+
 @cli.command()
 def datasette_serve(  # noqa: PLR0913
     database_path: Path = typer.Argument(
@@ -790,6 +1026,8 @@ def datasette_serve(  # noqa: PLR0913
     verbose: bool = typer.Option(False, help="Display verbose debugging output"),
 ) -> None:
     """🏃 Start a local datasette server."""
+    from chasten import database
+
     # output the preamble, including extra parameters specific to this function
     output_preamble(
         verbose,
@@ -799,11 +1037,6 @@ def datasette_serve(  # noqa: PLR0913
         datasette_port=port,
         metadata=metadata,
     )
-    # setup the console and the logger through the output module
-    output.setup(debug_level, debug_destination)
-    output.logger.debug(f"Display verbose output? {verbose}")
-    output.logger.debug(f"Debug level? {debug_level.value}")
-    output.logger.debug(f"Debug destination? {debug_destination.value}")
     # display diagnostic information about the datasette instance
     label = ":sparkles: Starting a local datasette instance:"
     display_serve_or_publish_details(
@@ -865,6 +1098,8 @@ def datasette_publish(  # noqa: PLR0913
     verbose: bool = typer.Option(False, help="Display verbose debugging output"),
 ) -> None:
     """🌎 Publish a datasette to Fly or Vercel."""
+    from chasten import database
+
     # output the preamble, including extra parameters specific to this function
     output_preamble(
         verbose,
@@ -873,18 +1108,18 @@ def datasette_publish(  # noqa: PLR0913
         database=database_path,
         metadata=metadata,
     )
-    # setup the console and the logger through the output module
-    output.setup(debug_level, debug_destination)
-    output.logger.debug(f"Display verbose output? {verbose}")
-    output.logger.debug(f"Debug level? {debug_level.value}")
-    output.logger.debug(f"Debug destination? {debug_destination.value}")
-    output.console.print()
-    output.console.print(
-        f":wave: Make sure that you have previously logged into the '{datasette_platform.value}' platform"
-    )
-    # display details about the publishing step
-    label = f":sparkles: Publishing a datasette to {datasette_platform.value}:"
-    display_serve_or_publish_details(label, database_path, metadata, publish=True)
+    # output the reminder to log in and the details about
+    # the publishing step with a single print to the console
+    with output.BatchConsole() as batch_console:
+        batch_console.print()
+        batch_console.print(
+            f":wave: Make sure that you have previously logged into the '{datasette_platform.value}' platform"
+        )
+        # display details about the publishing step
+        label = f":sparkles: Publishing a datasette to {datasette_platform.value}:"
+        display_serve_or_publish_details(
+            label, database_path, metadata, publish=True, batch_console=batch_console
+        )
     # publish the datasette instance using fly.io;
     # this passes control to datasette and then to
     # the fly program that must be installed
@@ -900,6 +1135,8 @@ def datasette_publish(  # noqa: PLR0913
 @cli.command()
 def log() -> None:
     """🦚 Start the logging server."""
+    from chasten import server
+
     # display the header
     output.print_header()
     # display details about the server
@@ -3,9 +3,8 @@
 import logging
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
-from pyastgrep import search as pyastgrepsearch  # type: ignore
 from rich.console import Console
 from rich.panel import Panel
 from rich.syntax import Syntax
@@ -22,6 +21,35 @@ console = Console()
 small_bullet_unicode = constants.markers.Small_Bullet_Unicode
 
 
+class BatchConsole:
+    """Collect the lines for the console and display them all at once."""
+
+    def __init__(self) -> None:
+        """Create an empty list of lines to display."""
+        self.lines: List[str] = []
+
+    def __enter__(self) -> "BatchConsole":
+        """Start collecting the lines to display."""
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        """Display all of the collected lines."""
+        self.flush()
+
+    def print(self, text: str = constants.markers.Empty_String) -> None:
+        """Collect a line instead of immediately displaying it."""
+        self.lines.append(text)
+
+    def flush(self) -> None:
+        """Display all of the collected lines with a single print to the console."""
+        global console  # noqa: disable=PLW0603
+        # display the lines with one call so that rich formats and
+        # writes the output a single time instead of once for each line
+        if self.lines:
+            console.print(constants.markers.Newline.join(self.lines))
+            self.lines.clear()
+
+
 def setup(
     debug_level: debug.DebugLevel, debug_destination: debug.DebugDestination
 ) -> None:
@@ -31,10 +59,8 @@ def setup(
     # --> rich-based tracebacks to enable better debugging on program crash
     configuration.configure_tracebacks()
     # --> logging to keep track of key events during program execution;
-    # pass in the actual values as strings instead of using class enums
-    logger, _ = configuration.configure_logging(
-        debug_level.value, debug_destination.value
-    )
+    # note that the enums are strings and thus they are passed in directly
+    logger, _ = configuration.configure_logging(debug_level, debug_destination)
 
 
 def print_diagnostics(verbose: bool, **configurations: Any) -> None:
@@ -134,9 +160,13 @@ def shorten_file_name(file_name: str, max_length: int) -> str:
     return file_name
 
 
-def print_list_contents(container: List[Path]) -> None:
+def print_list_contents(
+    container: List[Path], batch_console: Union[BatchConsole, None] = None
+) -> None:
     """Display the contents of the list in an easy-to-read fashion."""
-    global console  # noqa: disable=PLW0603
+    # collect the lines and display them at once, unless the
+    # lines are part of a larger batch that is displayed later
+    list_console = BatchConsole() if batch_console is None else batch_console
     # group all of the files by the directory that contains them;
     # note that this is important because the contain can contain
     # paths that specify files in different directories
@@ -145,21 +175,27 @@ def print_list_contents(container: List[Path]) -> None:
     # --> display the name of the directory
     # --> display the name of each file stored in this directory
     for directory, files in grouped_files.items():
-        console.print(f"{small_bullet_unicode} Directory: {directory}")
+        list_console.print(f"{small_bullet_unicode} Directory: {directory}")
         filecount = 0
         for file_name in files:
             filecount = +1
-            console.print(
+            list_console.print(
                 f"  {small_bullet_unicode} File: '{shorten_file_name(file_name, 120)}'"
             )
-            console.print(
+            list_console.print(
                 f"  {small_bullet_unicode} file(s) {int(filecount)} in this directory"
             )
+    if batch_console is None:
+        list_console.flush()
 
 
 def print_analysis_details(chasten: results.Chasten, verbose: bool = False) -> None:
     """Print all of the verbose debugging details for the results of an analysis."""
     global console  # noqa: disable=PLW0603
+    # import pyastgrep only when displaying the matches so that
+    # the commands that do not display them start more quickly
+    from pyastgrep import search as pyastgrepsearch  # type: ignore
+
     # 1) Note: see the BaseModel definitions in results.py for more details
     # about the objects and their relationships
     # 2) Note: the _match object that is inside of a Match BaseModel subclass
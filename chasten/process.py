@@ -1,12 +1,53 @@
 """Analyze the abstract syntax tree, its XML-based representation, and/or the search results."""
 
 import json
-from typing import Any, Dict, List, Tuple, Union
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
 
+import elementpath  # type: ignore
+from lxml import etree  # type: ignore
+from lxml.etree import _Element  # type: ignore
+from pyastgrep import asts as pyastgrepasts  # type: ignore
+from pyastgrep import files as pyastgrepfiles  # type: ignore
 from pyastgrep import search as pyastgrepsearch  # type: ignore
 from thefuzz import fuzz  # type: ignore
 
-from chasten import constants, enumerations
+from chasten import astcache, constants, enumerations, filesystem
+
+# the smallest number of source files that are searched in separate processes
+parallel_search_minimum_files = 64
+# the number of source files that a separate process searches at once
+parallel_chunk_size = 8
+
+
+def is_check_selected(
+    check: Dict[str, Union[str, Dict[str, int]]],
+    check_attribute: enumerations.FilterableAttribute,
+    check_match: str,
+    check_confidence: int = constants.checks.Check_Confidence,
+    include: bool = True,
+) -> bool:
+    """Determine whether or not a check is kept by an include or an exclude."""
+    # at least one aspect of the inputs was not specified (likely due to
+    # the fact that the command-line argument(s) were not used) and thus
+    # there is no filtering that should take place; keep the check
+    if check_attribute is None or check_match is None:
+        return True
+    # extract the contents of the requested attribute for inclusion
+    check_requested_include_attribute = check[check_attribute]
+    # compute the fuzzy match value for the specific:
+    # --> requested include attribute
+    # --> specified match string
+    fuzzy_value = fuzz.ratio(check_match, check_requested_include_attribute)
+    # keep the check if the fuzzy inclusion value is above (or equal to) threshold
+    # and the purpose of the function call is to include values or if the fuzzy
+    # inclusion value is below threshold and the purpose is to exclude values;
+    # note that not including a value means that it excludes
+    return (fuzzy_value >= check_confidence) == include
 
 
 def include_or_exclude_checks(
@@ -17,30 +58,35 @@ def include_or_exclude_checks(
     include: bool = True,
 ) -> List[Dict[str, Union[str, Dict[str, int]]]]:
     """Perform all of the includes and excludes for the list of checks."""
-    filtered_checks = []
     # at least one aspect of the inputs was not specified (likely due to
     # the fact that the command-line argument(s) were not used) and thus
     # there is no filtering that should take place; return the input
     if check_attribute is None or check_match is None:
         return checks
     # the function's inputs are valid and so perform the filtering
-    for check in checks:
-        # extract the contents of the requested attribute for inclusion
-        check_requested_include_attribute = check[check_attribute]
-        # compute the fuzzy match value for the specific:
-        # --> requested include attribute
-        # --> specified match string
-        fuzzy_value = fuzz.ratio(check_match, check_requested_include_attribute)
-        # include the check if the fuzzy inclusion value is above (or equal to) threshold
-        # and the purpose of the function call is to include values
-        if (fuzzy_value >= check_confidence) and include:
-            filtered_checks.append(check)
-        # include the check if the fuzzy inclusion value is below threshold
-        # and the purpose of the function call is to exclude values;
-        # note that not including a value means that it excludes
-        elif (fuzzy_value < check_confidence) and not include:
-            filtered_checks.append(check)
-    return filtered_checks
+    return [
+        check
+        for check in checks
+        if is_check_selected(
+            check, check_attribute, check_match, check_confidence, include
+        )
+    ]
+
+
+def filter_checks(
+    checks: List[Dict[str, Union[str, Dict[str, int]]]],
+    check_include: Tuple[enumerations.FilterableAttribute, str, int],
+    check_exclude: Tuple[enumerations.FilterableAttribute, str, int],
+) -> List[Dict[str, Union[str, Dict[str, int]]]]:
+    """Perform the include and the exclude for the list of checks in a single pass."""
+    # keep the checks that are included and not excluded, applying
+    # both of the criteria to each check as the list is traversed
+    return [
+        check
+        for check in checks
+        if is_check_selected(check, *check_include, include=True)
+        and is_check_selected(check, *check_exclude, include=False)
+    ]
 
 
 def filter_matches(
@@ -94,8 +140,188 @@ def organize_matches(
     return match_dict
 
 
-def combine_dicts(dict_list: List[Dict[Any, Any]]) -> str:
-    """Combine all dictionaries in the list into a single list of dictionaries as a string."""
+def stream_organize_matches(
+    match_generator: Iterable[Union[pyastgrepsearch.Match, Any]],
+    data_type,
+) -> Tuple[Dict[str, List[pyastgrepsearch.Match]], int]:
+    """Filter and organize the matches on a per-file basis in a single pass."""
+    match_dict: Dict[str, List[pyastgrepsearch.Match]] = defaultdict(list)
+    match_count = 0
+    # iterate through each of the (potential) matches a single time, only
+    # keeping those of the specified type and creating a dictionary so that
+    # --> the key is the name of a file under analysis
+    # --> the value is a list of all of the matches for that file
+    for current_match in match_generator:
+        if isinstance(current_match, data_type):
+            match_dict[str(current_match.path)].append(current_match)
+            match_count += 1
+    # return a standard dictionary so that looking up a file
+    # without matches does not add an entry for that file
+    return (dict(match_dict), match_count)
+
+
+def parse_python_file(path: Path) -> Union[Tuple[Any, List[str]], None]:
+    """Parse a Python source file into its XML-based AST and its lines."""
+    # read the file, skipping it when it cannot be read; note that each file
+    # is parsed a single time and searched with all of the patterns and thus
+    # its XML is not kept in memory after the search of the file is complete
+    path_name = str(path.absolute())
+    try:
+        contents = path.read_bytes()
+    except OSError:
+        return None
+    # use the XML from an earlier run of chasten when these exact
+    # contents were already parsed and saved in the on-disk cache
+    cached_file = astcache.load(contents)
+    if cached_file is not None:
+        return cached_file
+    # parse the file in the same way as pyastgrep, skipping
+    # the file when it does not contain valid Python
+    try:
+        (str_contents, parsed_ast) = pyastgrepfiles.parse_python_file(
+            contents, path_name, auto_dedent=False
+        )
+    except SyntaxError:
+        return None
+    # convert the AST to XML; note that the mapping from XML elements
+    # back to AST nodes is not needed because the position of a match
+    # is available in the attributes of the XML elements
+    xml_ast = pyastgrepasts.ast_to_xml(parsed_ast, {})
+    file_lines = str_contents.splitlines()
+    astcache.save(contents, xml_ast, file_lines)
+    return (xml_ast, file_lines)
+
+
+def is_ast_element(element: Any) -> bool:
+    """Determine whether an XML element represents an AST node instead of a field of a node."""
+    # the XML alternates between elements for AST nodes and elements for
+    # the fields of those nodes, starting with an AST node at the root;
+    # an "item" element stores a non-AST value inside of a list field
+    depth = sum(1 for _ in element.iterancestors())
+    return depth % 2 == 0 and element.tag != "item"
+
+
+def position_from_element(element: Any) -> Union[pyastgrepsearch.Position, None]:
+    """Determine the position of an AST node using its XML element or its closest ancestor."""
+    # an AST node that does not have a position (e.g., an arguments node)
+    # uses the position of its parent AST node, which is the grandparent
+    # of the element since the parent of the element is a field element
+    while element is not None:
+        lineno = element.get("lineno")
+        col_offset = element.get("col_offset")
+        if lineno is not None and col_offset is not None:
+            return pyastgrepsearch.Position(int(lineno), int(col_offset))
+        parent = element.getparent()
+        element = parent.getparent() if parent is not None else None
+    return None
+
+
+@lru_cache(maxsize=None)
+def compile_xpath(expression: str, xpath2: bool = True) -> Callable[[Any], Any]:
+    """Compile an XPATH expression a single time so that it can search many XML-based ASTs."""
+    # use elementpath for XPATH 2.0 in the same way as pyastgrep
+    if xpath2:
+        return elementpath.Selector(expression).select
+    # use lxml for XPATH 1.0 in the same way as pyastgrep
+    return etree.XPath(expression)
+
+
+def search_xml_ast(
+    xml_ast: Any, query: Callable[[Any], Any]
+) -> List[pyastgrepsearch.Position]:
+    """Search the XML-based AST of a Python source file with a compiled XPATH expression."""
+    matching_elements = query(xml_ast)
+    # the expression did not produce a list of elements (e.g., it
+    # counted the elements) and thus there are no matches
+    if not isinstance(matching_elements, list):
+        return []
+    # find the position of each element that corresponds to an AST node,
+    # skipping all of the other values produced by the XPATH expression
+    positions = []
+    for element in matching_elements:
+        if not isinstance(element, _Element) or not is_ast_element(element):
+            continue
+        position = position_from_element(element)
+        if position is not None:
+            positions.append(position)
+    return positions
+
+
+def search_python_file(
+    path: Path, patterns: List[str], xpath2: bool = True
+) -> Union[Tuple[List[str], List[List[pyastgrepsearch.Position]], int, int], None]:
+    """Search the XML-based AST of a Python source file with each of the XPATH expressions."""
+    # parse the file, keeping track of whether or not
+    # the XML came from the on-disk cache of the ASTs
+    (cache_hits, cache_misses) = astcache.get_statistics()
+    parsed_file = parse_python_file(path)
+    (new_cache_hits, new_cache_misses) = astcache.get_statistics()
+    # skip any files that cannot be read or that do not contain valid Python
+    if parsed_file is None:
+        return None
+    (xml_ast, file_lines) = parsed_file
+    # elementpath searches a tree of XPATH nodes that wraps the XML and,
+    # when given the XML, builds this tree again for every query; build it a
+    # single time so that all of the queries walk the same tree in memory
+    search_root = elementpath.get_node_tree(xml_ast) if xpath2 else xml_ast
+    # run all of the queries on this file while its XML is available; note that
+    # the result only contains positions instead of XML elements so that
+    # it can be returned from a separate process
+    positions = [
+        search_xml_ast(search_root, compile_xpath(pattern, xpath2))
+        for pattern in patterns
+    ]
+    # the lines of a file without any matches are not needed and thus they
+    # are not returned, which avoids sending them back from a separate process
+    if not any(positions):
+        file_lines = []
+    return (
+        file_lines,
+        positions,
+        new_cache_hits - cache_hits,
+        new_cache_misses - cache_misses,
+    )
+
+
+def search_python_files(
+    paths: List[Path], patterns: List[str], xpath2: bool = True
+) -> List[List[pyastgrepsearch.Match]]:
+    """Search the XML-based AST of each Python source file with each of the XPATH expressions."""
+    search_function = partial(search_python_file, patterns=patterns, xpath2=xpath2)
+    # search the files in separate processes when there are enough of them
+    # to make up for the cost of starting the processes; note that each file
+    # is parsed and searched independently of all of the other files
+    search_in_parallel = (
+        len(paths) >= parallel_search_minimum_files and (os.cpu_count() or 1) > 1
+    )
+    if search_in_parallel:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            search_results = list(
+                executor.map(search_function, paths, chunksize=parallel_chunk_size)
+            )
+    else:
+        search_results = [search_function(path) for path in paths]
+    # create a list of matches for each of the patterns, keeping
+    # the matches for each pattern in the order of the files
+    matches: List[List[pyastgrepsearch.Match]] = [[] for _ in patterns]
+    for path, search_result in zip(paths, search_results):
+        if search_result is None:
+            continue
+        (file_lines, positions, cache_hits, cache_misses) = search_result
+        # the on-disk cache of the ASTs was used in a separate process
+        # and thus its statistics must be recorded in this process
+        if search_in_parallel:
+            astcache.add_statistics(cache_hits, cache_misses)
+        for pattern_positions, pattern_matches in zip(positions, matches):
+            pattern_matches.extend(
+                pyastgrepsearch.Match(path, file_lines, None, position, None)
+                for position in pattern_positions
+            )
+    return matches
+
+
+def combine_dicts(dict_list: List[Dict[Any, Any]]) -> bytes:
+    """Combine all dictionaries in the list into a single list of dictionaries as UTF-8 bytes."""
     # combine all of the dictionaries in the list into
     # a single string that is a list of each JSON-based
     # dictionary represented as a string; this leads to:
@@ -105,5 +331,10 @@ def combine_dicts(dict_list: List[Dict[Any, Any]]) -> str:
     #   ...
     #   { nested JSON for file n }
     # ]
-    # which is a list of valid JSON objects
-    return json.dumps(dict_list, indent=2)
+    # which is a list of valid JSON objects; note that orjson creates
+    # the bytes directly instead of first creating an indented string
+    # with the encoder from the standard library that is written in Python
+    # and that both of them write non-ASCII text without escaping it
+    if filesystem.orjson is not None:
+        return filesystem.orjson.dumps(dict_list, option=filesystem.orjson.OPT_INDENT_2)
+    return json.dumps(dict_list, indent=2, ensure_ascii=False).encode("utf-8")
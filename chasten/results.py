@@ -3,14 +3,18 @@
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
-from pyastgrep import search as pyastgrepsearch  # type: ignore
 from pydantic import BaseModel
 from pydantic.types import conint
 
 from chasten import debug
 
+# pyastgrep is only needed to annotate the matches and thus it is
+# not imported when the results are created, saved, or loaded
+if TYPE_CHECKING:
+    from pyastgrep import search as pyastgrepsearch  # type: ignore
+
 # Note: the nesting of the class definitions is from the
 # bottom of this file to the top because the top-level
 # object can only refer to others that already exist
@@ -73,7 +77,7 @@ class Check(BaseModel):
     pattern: str
     passed: bool
     matches: list[Match] = []
-    _matches: list[pyastgrepsearch.Match] = []
+    _matches: list["pyastgrepsearch.Match"] = []
 
 
 class Source(BaseModel):
@@ -1,8 +1,11 @@
 """Utilities for use within chasten."""
 
+import array
 import importlib.metadata
 import platform
 import sys
+from functools import cache
+from typing import Union
 
 from urllib3.util import parse_url
 
@@ -10,7 +13,10 @@ from chasten import constants
 
 checkmark_unicode = "\u2713"
 xmark_unicode = "\u2717"
+checkmark_symbol = f"[green]{checkmark_unicode}[/green]"
+xmark_symbol = f"[red]{xmark_unicode}[/red]"
 default_chasten_semver = "0.0.0"
+url_scheme_prefixes = ("http:", "https:")
 
 
 def get_human_readable_boolean(answer: bool) -> str:
@@ -22,6 +28,7 @@ def get_human_readable_boolean(answer: bool) -> str:
     return constants.humanreadable.No
 
 
+@cache
 def get_OS() -> str:
     """Gets the Operating system of the user."""
     OpSystem = platform.system()
@@ -41,13 +48,18 @@ def executable_name(executable_name: str, OpSystem: str = "Linux") -> str:
 
 def get_symbol_boolean(answer: bool) -> str:
     """Produce a symbol-formatted version of a boolean value of True or False."""
+    # return one of the symbols that are formatted a single time
     if answer:
-        return f"[green]{checkmark_unicode}[/green]"
-    return f"[red]{xmark_unicode}[/red]"
+        return checkmark_symbol
+    return xmark_symbol
 
 
+@cache
 def get_chasten_version() -> str:
     """Use importlib to extract the version of the package."""
+    # note that the version is cached because finding it requires a search
+    # through the metadata of the installed packages and it cannot change
+    # while chasten is running
     # attempt to determine the current version of the entire package,
     # bearing in mind that this program appears on PyPI with the name "chasten";
     # this will then return the version string specified with the version attribute
@@ -72,11 +84,13 @@ def join_and_preserve(data, start, end):
 
 def is_url(url: str) -> bool:
     """Determine if string is valid URL."""
+    # only allow http and https; note that the parsed scheme is in lowercase
+    # and thus a string without one of these prefixes (e.g., the name of a
+    # file) is not a URL and it does not need to be parsed
+    if not url.lower().startswith(url_scheme_prefixes):
+        return False
     # parse input url
     url_parsed = parse_url(url)
-    # only allow http and https
-    if url_parsed.scheme not in ["http", "https"]:
-        return False
     # only input characters for initiatig query and/or fragments if necessary
     port_character = ":" if url_parsed.port is not None else ""
     query_character = "?" if url_parsed.query is not None else ""
@@ -95,28 +109,29 @@ def is_url(url: str) -> bool:
     ]
     # convert every item to a string and piece the url back together
     # to make sure it matches what was given
-    url_reassembled = ""
-    for url_piece in url_pieces:
-        if url_piece is not None:
-            url_reassembled += str(url_piece)
-    # determine if parsed and reconstructed url matches original
-    return str(parse_url(url)).lower() == url_reassembled.lower()
+    url_reassembled = "".join(
+        str(url_piece) for url_piece in url_pieces if url_piece is not None
+    )
+    # determine if parsed and reconstructed url matches original; note
+    # that the already parsed url is reused instead of parsing it again
+    return url_parsed.url.lower() == url_reassembled.lower()
 
 
-def total_amount_passed(check_status_list: list[bool]) -> tuple[int, int, float]:
+def total_amount_passed(
+    check_status_list: Union[list[bool], array.array],
+) -> tuple[int, int, float]:
     """Calculate amount of checks passed in analyze"""
-    # attempt calculations for percentage of checks passed
-    try:
-        # calculate total amount of checks in list
-        count_total = len(check_status_list)
-        # count total amount of checks counted as true
-        count_passed = check_status_list.count(True)
-        # return tuple of checks passed, total checks, percentage of checks passed
-        return (
-            count_passed,
-            count_total,
-            (count_passed / count_total) * constants.markers.Percent_Multiplier,
-        )
-    # return exception of zeros when dividing by zero
-    except ZeroDivisionError:
+    # calculate total amount of checks in list
+    count_total = len(check_status_list)
+    # return zeros instead of dividing by zero when there are no checks
+    if count_total == 0:
         return (0, 0, 0.0)
+    # count total amount of checks counted as true; note that the built-in
+    # sum counts both booleans and the small integers of an array
+    count_passed = int(sum(check_status_list))
+    # return tuple of checks passed, total checks, percentage of checks passed
+    return (
+        count_passed,
+        count_total,
+        (count_passed / count_total) * constants.markers.Percent_Multiplier,
+    )
@@ -0,0 +1,14 @@
+"""Configure the Pytest test suite for chasten."""
+
+import pytest
+
+from chasten import astcache, constants
+
+
+@pytest.fixture(autouse=True)
+def isolated_ast_cache(tmp_path_factory, monkeypatch):
+    """Store the cached ASTs in a temporary directory instead of the user's cache directory."""
+    ast_cache_directory = tmp_path_factory.mktemp(constants.chasten.Ast_Cache_Directory)
+    monkeypatch.setattr(astcache, "get_cache_directory", lambda: ast_cache_directory)
+    monkeypatch.delenv(constants.chasten.Ast_Cache_Disable_Variable, raising=False)
+    return ast_cache_directory
@@ -0,0 +1,82 @@
+"""Pytest test suite for the astcache module."""
+
+import os
+import pickle
+from unittest.mock import patch
+
+from lxml import etree
+
+from chasten import astcache, constants
+
+
+def test_create_cache_key_depends_on_contents():
+    """Confirm that different contents of a source file have different keys."""
+    first_key = astcache.create_cache_key(b"x = 1\n")
+    assert first_key == astcache.create_cache_key(b"x = 1\n")
+    assert first_key != astcache.create_cache_key(b"x = 2\n")
+
+
+@patch("chasten.astcache.get_cache_directory")
+def test_load_when_not_cached(mock_get_cache_directory, tmp_path):
+    """Confirm that loading contents that were never saved is a cache miss."""
+    mock_get_cache_directory.return_value = tmp_path
+    (_, misses_before) = astcache.get_statistics()
+    assert astcache.load(b"x = 1\n") is None
+    assert astcache.get_statistics()[1] == misses_before + 1
+
+
+@patch("chasten.astcache.get_cache_directory")
+def test_save_and_load(mock_get_cache_directory, tmp_path):
+    """Confirm that saved contents are loaded from the cache."""
+    mock_get_cache_directory.return_value = tmp_path / "source-ast-cache"
+    xml_ast = etree.fromstring(
+        '<Module><body><Pass lineno="1" col_offset="0"/></body></Module>'
+    )
+    astcache.save(b"pass\n", xml_ast, ["pass"])
+    (hits_before, _) = astcache.get_statistics()
+    cached_file = astcache.load(b"pass\n")
+    assert cached_file is not None
+    (cached_xml_ast, cached_file_lines) = cached_file
+    assert etree.tostring(cached_xml_ast) == etree.tostring(xml_ast)
+    assert cached_file_lines == ["pass"]
+    assert astcache.get_statistics()[0] == hits_before + 1
+
+
+def test_load_and_save_when_disabled(isolated_ast_cache, monkeypatch):
+    """Confirm that the environment variable disables the cache."""
+    monkeypatch.setenv(constants.chasten.Ast_Cache_Disable_Variable, "1")
+    xml_ast = etree.fromstring("<Module/>")
+    astcache.save(b"pass\n", xml_ast, ["pass"])
+    assert not list(isolated_ast_cache.iterdir())
+    assert astcache.load(b"pass\n") is None
+
+
+def test_load_malformed_entry(isolated_ast_cache):
+    """Confirm that a malformed entry in the cache is a cache miss."""
+    cache_file = isolated_ast_cache / astcache.create_cache_key(b"pass\n")
+    cache_file.write_bytes(pickle.dumps((1, ["pass"])))
+    assert astcache.load(b"pass\n") is None
+    cache_file.write_bytes(pickle.dumps(None))
+    assert astcache.load(b"pass\n") is None
+
+
+def test_save_removes_temporary_file_on_error(isolated_ast_cache):
+    """Confirm that a failure to write an entry does not leave behind a temporary file."""
+    with patch("chasten.astcache.os.replace", side_effect=OSError):
+        astcache.save(b"pass\n", etree.fromstring("<Module/>"), ["pass"])
+    assert not list(isolated_ast_cache.iterdir())
+
+
+def test_prune_removes_least_recently_used(isolated_ast_cache):
+    """Confirm that pruning removes the entries used the longest time ago."""
+    for position in range(3):
+        cache_file = isolated_ast_cache / f"entry-{position}"
+        cache_file.write_bytes(b"x" * 10)
+        os.utime(cache_file, ns=(position * 10**9, position * 10**9))
+    assert astcache.prune(maximum_size=20) == 1
+    assert sorted(path.name for path in isolated_ast_cache.iterdir()) == [
+        "entry-1",
+        "entry-2",
+    ]
+    assert astcache.prune(maximum_size=0) == 2  # noqa: PLR2004
+    assert not list(isolated_ast_cache.iterdir())
@@ -7,6 +7,7 @@ from hypothesis_jsonschema import from_schema
 
 from chasten.checks import (
     check_match_count,
+    create_check_spec,
     extract_min_max,
     is_in_closed_interval,
 )
@@ -108,3 +109,22 @@ def test_check_match_count(count, min, max):
     confirmation = check_match_count(count, min, max)
     if is_in_closed_interval(count, min, max):
         assert confirmation
+
+
+def test_create_check_spec():
+    """Confirm that the specification of a check contains all of its details."""
+    check = {
+        "name": "non-test-function-definition",
+        "code": "NTF",
+        "id": "F002",
+        "pattern": './/FunctionDef[not(contains(@name, "test_"))]',
+        "count": {"min": 1, "max": 10},
+    }
+    spec = create_check_spec(check)  # type: ignore
+    assert spec.id == "F002"
+    assert spec.name == "non-test-function-definition"
+    assert spec.description == ""
+    assert spec.pattern == './/FunctionDef[not(contains(@name, "test_"))]'
+    assert spec.pattern_escaped == './/FunctionDef\\[not(contains(@name, "test_"))]'
+    assert spec.min == 1
+    assert spec.max == 10  # noqa
@@ -0,0 +1,43 @@
+"""Pytest test suite for the database module."""
+
+import sqlite3
+
+from chasten import constants, database
+
+
+def test_configure_chasten_database(tmp_path):
+    """Confirm that the view and the full-text search are created for the results."""
+    database_file_name = str(tmp_path / constants.datasette.Chasten_Database)
+    connection = sqlite3.connect(database_file_name)
+    connection.executescript(
+        """
+        CREATE TABLE main (_link, configuration_chastenversion,
+            configuration_projectname, configuration_datetime);
+        CREATE TABLE sources (_link, _link_main, filename, check_id, check_name,
+            check_description, check_pattern, check_min, check_max, check_passed);
+        CREATE TABLE sources_check_matches (_link, _link_sources, _link_main,
+            lineno, coloffset, linematch, linematch_context);
+        INSERT INTO main VALUES ('0', '0.2.0', 'lazytracker', '2023-10-15');
+        INSERT INTO sources VALUES ('0.sources.0', '0', 'tracker.py', 'C001',
+            'class-definition', '', './/ClassDef', 1, NULL, 'true');
+        INSERT INTO sources_check_matches VALUES ('0.sources.0.check.matches.0',
+            '0.sources.0', '0', 1, 0, 'class Tracker:', 'class Tracker:');
+        """
+    )
+    connection.close()
+    database.configure_chasten_database(database_file_name)
+    connection = sqlite3.connect(database_file_name)
+    assert connection.execute(
+        f"SELECT projectname, filename, linematch FROM {constants.chasten.Chasten_Database_View}"
+    ).fetchall() == [("lazytracker", "tracker.py", "class Tracker:")]
+    assert connection.execute(
+        "SELECT rowid FROM sources_check_matches_fts WHERE linematch MATCH 'Tracker'"
+    ).fetchall() == [(1,)]
+    assert connection.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+    assert "idx_sources_check_matches__link_sources" in str(
+        connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM sources_check_matches"
+            + " WHERE _link_sources = '0.sources.0'"
+        ).fetchall()
+    )
+    connection.close()
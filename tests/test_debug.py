@@ -55,3 +55,10 @@ def test_debug_destination_invalid():
     """Confirm that invalid values raise a ValueError."""
     with pytest.raises(ValueError):
         DebugDestination("INVALID")
+
+
+def test_debug_enumerations_are_strings():
+    """Confirm that the enumerations format as their values without using value."""
+    assert str(DebugLevel.ERROR) == "ERROR"
+    assert f"{DebugDestination.SYSLOG}" == "SYSLOG"
+    assert isinstance(DebugLevel.DEBUG, str)
@@ -1,6 +1,7 @@
 """Pytest test suite for the filesystem module."""
 
 import pathlib
+import sqlite3
 from pathlib import Path
 from unittest.mock import patch
 
@@ -8,7 +9,7 @@ import pytest
 from hypothesis import given, strategies
 from rich.tree import Tree
 
-from chasten import constants, filesystem
+from chasten import constants, debug, filesystem, results
 
 
 def test_valid_directory() -> None:
@@ -240,3 +241,210 @@ def test_create_checks_configuration_file(mock_user_config_dir, tmp_path):
     assert main_configuation_file.exists()
     # confirm that the configuration file has correct text
     assert main_configuation_file.read_text() == filesystem.CHECKS_FILE_DEFAULT_CONTENTS
+
+
+def test_get_python_source_files(tmp_path):
+    """Confirm that only the Python source files are found in a directory."""
+    (tmp_path / "first.py").touch()
+    (tmp_path / "notes.txt").touch()
+    (tmp_path / "subdir").mkdir()
+    (tmp_path / "subdir" / "second.py").touch()
+    source_files = filesystem.get_python_source_files([tmp_path])
+    assert sorted(path.name for path in source_files) == ["first.py", "second.py"]
+
+
+def test_write_chasten_results(tmp_path):
+    """Confirm that the written results contain the JSON of the results."""
+    results_content = results.Chasten(
+        configuration=results.Configuration(
+            chastenversion="0.1.0",
+            debuglevel=debug.DebugLevel.ERROR,
+            debugdestination=debug.DebugDestination.CONSOLE,
+            projectname="lazytracker",
+            configdirectory=tmp_path,
+            searchpath=tmp_path,
+        ),
+        sources=[results.Source(filename="example.py")],
+    )
+    results_file_name = filesystem.write_chasten_results(
+        tmp_path, "lazytracker", results_content, save=True
+    )
+    assert (tmp_path / results_file_name).read_text(
+        "utf-8"
+    ) == results_content.model_dump_json(indent=2)
+    assert (
+        filesystem.write_chasten_results(
+            tmp_path, "lazytracker", results_content, save=False
+        )
+        == constants.markers.Empty_String
+    )
+
+
+def test_read_integration_manifest(tmp_path):
+    """Confirm that a manifest maps each project to its paths relative to the manifest."""
+    results_directory = tmp_path / "results"
+    results_directory.mkdir()
+    json_file = tmp_path / "chasten-results-a.json"
+    json_file.write_text("{}", "utf-8")
+    manifest_file = tmp_path / "manifest.yml"
+    manifest_file.write_text(
+        "first:\n  - chasten-results-a.json\n  - results\nsecond: results\n", "utf-8"
+    )
+    assert filesystem.read_integration_manifest(manifest_file) == (
+        True,
+        {"first": [json_file, results_directory], "second": [results_directory]},
+    )
+
+
+@pytest.mark.parametrize(
+    "manifest_contents", ["", "- results\n", "first: 1\n", "first: missing\n"]
+)
+def test_read_integration_manifest_invalid(tmp_path, manifest_contents):
+    """Confirm that an invalid manifest or a missing path is not accepted."""
+    (tmp_path / "results").mkdir()
+    manifest_file = tmp_path / "manifest.yml"
+    manifest_file.write_text(manifest_contents, "utf-8")
+    assert filesystem.read_integration_manifest(manifest_file) == (False, {})
+
+
+def test_find_json_results(tmp_path):
+    """Confirm that the JSON result files in a directory are found along with the given files."""
+    results_directory = tmp_path / "results"
+    results_directory.mkdir()
+    second_json_file = results_directory / "chasten-results-b.json"
+    second_json_file.write_text("{}", "utf-8")
+    first_json_file = results_directory / "chasten-results-a.json"
+    first_json_file.write_text("{}", "utf-8")
+    (results_directory / "chasten-integrated-results-a.json").write_text("{}")
+    (results_directory / "chasten-results-notes.txt").write_text("notes")
+    (results_directory / "chasten-results-c.json").mkdir()
+    given_json_file = tmp_path / "given.json"
+    given_json_file.write_text("{}", "utf-8")
+    assert filesystem.find_json_results([results_directory, given_json_file]) == [
+        first_json_file,
+        second_json_file,
+        given_json_file,
+    ]
+
+
+def test_find_json_results_missing_path(tmp_path):
+    """Confirm that a path that does not exist is not silently skipped."""
+    with pytest.raises(FileNotFoundError):
+        filesystem.find_json_results([tmp_path / "missing"])
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_get_json_results(tmp_path, monkeypatch, use_orjson):
+    """Confirm that the JSON files are parsed with or without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(filesystem, "orjson", None)
+    first_json_file = tmp_path / "first.json"
+    first_json_file.write_text('{"sources": [{"filename": "ü.py"}]}', "utf-8")
+    second_json_file = tmp_path / "second.json"
+    second_json_file.write_text('{"sources": []}', "utf-8")
+    assert list(
+        filesystem.iterate_json_results([first_json_file, second_json_file])
+    ) == filesystem.get_json_results([first_json_file, second_json_file])
+    assert filesystem.get_json_results([first_json_file, second_json_file]) == [
+        {"sources": [{"filename": "ü.py"}]},
+        {"sources": []},
+    ]
+
+
+def test_write_flattened_csv_and_database(tmp_path):
+    """Confirm that the dictionaries of results are flattened into CSV files and a database."""
+    json_dicts = [
+        {
+            "configuration": {
+                "chastenversion": "0.2.0",
+                "projectname": projectname,
+                "datetime": "2023-10-15 10:00:00",
+            },
+            "sources": [
+                {
+                    "filename": f"{projectname}.py",
+                    "check": {
+                        "id": "C001",
+                        "name": "class-definition",
+                        "description": "",
+                        "min": 1,
+                        "max": None,
+                        "pattern": ".//ClassDef",
+                        "passed": True,
+                        "matches": [
+                            {
+                                "lineno": 1,
+                                "coloffset": 0,
+                                "linematch": "class Tracker:",
+                                "linematch_context": "class Tracker:",
+                            }
+                        ],
+                    },
+                }
+            ],
+        }
+        for projectname in ["lazytracker", "multicounter"]
+    ]
+    flattened_directory = Path(
+        filesystem.write_flattened_csv_and_database(iter(json_dicts), tmp_path, "all")
+    )
+    assert (flattened_directory / "csv" / "sources.csv").exists()
+    connection = sqlite3.connect(
+        flattened_directory / constants.datasette.Chasten_Database
+    )
+    assert connection.execute(
+        f"SELECT projectname, filename FROM {constants.chasten.Chasten_Database_View}"
+        + " ORDER BY projectname"
+    ).fetchall() == [
+        ("lazytracker", "lazytracker.py"),
+        ("multicounter", "multicounter.py"),
+    ]
+    connection.close()
+
+
+def test_get_integrated_directory_uses_fingerprint(tmp_path):
+    """Confirm that an earlier integration is only reused for the same, unchanged JSON files."""
+    json_file = tmp_path / "results.json"
+    json_file.write_text("{}", "utf-8")
+    integrated_directory = tmp_path / "integrated"
+    integrated_directory.mkdir()
+    (integrated_directory / constants.datasette.Chasten_Database).touch()
+    fingerprint = filesystem.create_integration_fingerprint([json_file])
+    assert filesystem.get_integrated_directory(tmp_path, "all", fingerprint) is None
+    filesystem.write_integration_fingerprint(
+        tmp_path, "all", fingerprint, str(integrated_directory)
+    )
+    assert (
+        filesystem.get_integrated_directory(tmp_path, "all", fingerprint)
+        == integrated_directory
+    )
+    assert not list(tmp_path.glob("chasten-integrated-*"))
+    assert [path.name for path in tmp_path.glob("*.json")] == ["results.json"]
+    json_file.write_text('{"sources": []}', "utf-8")
+    changed_fingerprint = filesystem.create_integration_fingerprint([json_file])
+    assert changed_fingerprint != fingerprint
+    assert (
+        filesystem.get_integrated_directory(tmp_path, "all", changed_fingerprint)
+        is None
+    )
+
+
+def test_get_integrated_directory_needs_combined_file(tmp_path):
+    """Confirm that an earlier integration is not reused when its combined JSON file is gone."""
+    json_file = tmp_path / "results.json"
+    json_file.write_text("{}", "utf-8")
+    integrated_directory = tmp_path / "integrated"
+    integrated_directory.mkdir()
+    (integrated_directory / constants.datasette.Chasten_Database).touch()
+    combined_json_file = tmp_path / "chasten-integrated-results-all.json"
+    combined_json_file.write_text("[]", "utf-8")
+    fingerprint = filesystem.create_integration_fingerprint([json_file])
+    filesystem.write_integration_fingerprint(
+        tmp_path, "all", fingerprint, str(integrated_directory), combined_json_file.name
+    )
+    assert (
+        filesystem.get_integrated_directory(tmp_path, "all", fingerprint)
+        == integrated_directory
+    )
+    combined_json_file.unlink()
+    assert filesystem.get_integrated_directory(tmp_path, "all", fingerprint) is None
@@ -0,0 +1,52 @@
+"""Pytest test suite for the filesystem_cache module."""
+
+from chasten import filesystem_cache
+
+
+def test_cached_status_of_file_and_directory(tmp_path):
+    """Confirm that the cached status of a file and a directory is correct."""
+    file_path = tmp_path / "file.txt"
+    file_path.touch()
+    assert filesystem_cache.cached_exists(file_path)
+    assert filesystem_cache.cached_isfile(file_path)
+    assert not filesystem_cache.cached_isdir(file_path)
+    assert filesystem_cache.cached_exists(tmp_path)
+    assert filesystem_cache.cached_isdir(tmp_path)
+    assert not filesystem_cache.cached_isfile(tmp_path)
+
+
+def test_cached_status_of_missing_path_until_invalidated(tmp_path):
+    """Confirm that a missing path stays missing until its cached status is invalidated."""
+    file_path = tmp_path / "file.txt"
+    assert not filesystem_cache.cached_exists(file_path)
+    file_path.touch()
+    assert not filesystem_cache.cached_isfile(file_path)
+    filesystem_cache.invalidate(file_path)
+    assert filesystem_cache.cached_isfile(file_path)
+
+
+def test_invalidate_only_forgets_the_given_path(tmp_path):
+    """Confirm that invalidating a path keeps the cached status of the other paths."""
+    first_path = tmp_path / "first.txt"
+    second_path = tmp_path / "second.txt"
+    assert not filesystem_cache.cached_exists(first_path)
+    assert not filesystem_cache.cached_exists(second_path)
+    first_path.touch()
+    second_path.touch()
+    filesystem_cache.invalidate(first_path)
+    assert filesystem_cache.cached_exists(first_path)
+    assert not filesystem_cache.cached_exists(second_path)
+    filesystem_cache.clear()
+    assert filesystem_cache.cached_exists(second_path)
+
+
+def test_cached_status_expires(tmp_path, monkeypatch):
+    """Confirm that the cached status of a path is checked again after it expires."""
+    file_path = tmp_path / "file.txt"
+    current_time = [100.0]
+    monkeypatch.setattr(filesystem_cache.time, "monotonic", lambda: current_time[0])
+    assert not filesystem_cache.cached_exists(file_path)
+    file_path.touch()
+    assert not filesystem_cache.cached_exists(file_path)
+    current_time[0] += filesystem_cache.stat_cache_time_to_live
+    assert filesystem_cache.cached_exists(file_path)
@@ -1,6 +1,9 @@
 """Pytest test suite for the main module."""
 
 import os
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import patch
 
@@ -74,6 +77,21 @@ checks:
 """
 
 
+def test_import_main_does_not_import_ast_search():
+    """Confirm that importing the command-line interface does not import the modules for searching ASTs."""
+    imported = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, chasten.main; print(sorted({'pyastgrep', 'lxml.etree', 'chasten.astcache'} & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert imported.stdout.strip() == "[]"
+
+
 @pytest.fixture
 def cwd():
     """Define a test fixture for the current working directory."""
@@ -512,7 +530,7 @@ def test_analyze_store_results_file_exists_force(cwd, tmpdir):
 @given(directory=strategies.builds(Path))
 @settings(deadline=None, suppress_health_check=[HealthCheck.function_scoped_fixture])
 @pytest.mark.fuzz
-def test_analyze_store_results_valid_path(directory, cwd):
+def test_analyze_store_results_valid_path(directory, cwd, tmp_path):
     project_name = "testing"
     # create a reference to the internal
     # .chasten directory that supports testing
@@ -527,8 +545,172 @@ def test_analyze_store_results_valid_path(directory, cwd):
             "--config",
             configuration_directory,
             "--markdown-storage",
-            directory,
+            # store the markdown file in a temporary directory
+            # instead of the current working directory
+            tmp_path / directory,
             "--force",
         ],
     )
     assert result.exit_code == 0
+
+
+def create_chasten_results(cwd, tmp_path, project_name):
+    """Analyze a small Python program and return the directory with its saved JSON results."""
+    source_directory = tmp_path / f"{project_name}-source"
+    source_directory.mkdir()
+    (source_directory / "program.py").write_text(
+        "class Counter:\n    def count(self, value):\n        if value:\n            return 1\n        return 0\n",
+        "utf-8",
+    )
+    results_directory = tmp_path / f"{project_name}-results"
+    results_directory.mkdir()
+    result = runner.invoke(
+        main.cli,
+        [
+            "analyze",
+            project_name,
+            "--search-path",
+            str(source_directory),
+            "--config",
+            str(Path(cwd) / ".chasten"),
+            "--save-directory",
+            str(results_directory),
+            "--save",
+        ],
+    )
+    assert result.exit_code == 0
+    return results_directory
+
+
+def test_cli_integrate_reuses_unchanged_results(cwd, tmp_path):
+    """Confirm that integrating unchanged results again reuses the earlier integration."""
+    results_directory = create_chasten_results(cwd, tmp_path, "first")
+    output_directory = tmp_path / "integrated"
+    output_directory.mkdir()
+    integrate_arguments = [
+        "integrate",
+        "all",
+        str(results_directory),
+        "--save-directory",
+        str(output_directory),
+    ]
+    result = runner.invoke(main.cli, integrate_arguments)
+    assert result.exit_code == 0
+    assert "Already integrated" not in result.output
+    result = runner.invoke(main.cli, integrate_arguments)
+    assert result.exit_code == 0
+    assert "Already integrated" in result.output
+    assert len(list(output_directory.glob("chasten-flattened-*"))) == 1
+    result = runner.invoke(main.cli, [*integrate_arguments, "--force"])
+    assert result.exit_code == 0
+    assert "Already integrated" not in result.output
+    assert len(list(output_directory.glob("chasten-flattened-*"))) == 2  # noqa: PLR2004
+
+
+def test_cli_integrate_without_intermediate_is_not_reused(cwd, tmp_path):
+    """Confirm that an integration without the combined JSON file is not reused when it is needed."""
+    results_directory = create_chasten_results(cwd, tmp_path, "first")
+    output_directory = tmp_path / "integrated"
+    output_directory.mkdir()
+    integrate_arguments = [
+        "integrate",
+        "all",
+        str(results_directory),
+        "--save-directory",
+        str(output_directory),
+    ]
+    result = runner.invoke(main.cli, [*integrate_arguments, "--no-keep-intermediate"])
+    assert result.exit_code == 0
+    assert not list(output_directory.glob("chasten-integrated-results-*.json"))
+    result = runner.invoke(main.cli, integrate_arguments)
+    assert result.exit_code == 0
+    assert "Already integrated" not in result.output
+    assert len(list(output_directory.glob("chasten-integrated-results-*.json"))) == 1
+
+
+@pytest.mark.parametrize("create_directory", [True, False])
+def test_cli_integrate_without_json_results(tmp_path, create_directory):
+    """Confirm that integrating an empty or missing path stops without creating a database."""
+    results_directory = tmp_path / "results"
+    if create_directory:
+        results_directory.mkdir()
+    output_directory = tmp_path / "integrated"
+    output_directory.mkdir()
+    result = runner.invoke(
+        main.cli,
+        [
+            "integrate",
+            "all",
+            str(results_directory),
+            "--save-directory",
+            str(output_directory),
+        ],
+    )
+    assert result.exit_code == 1
+    assert "Cannot integrate" in result.output
+    assert not list(output_directory.iterdir())
+
+
+def test_cli_integrate_all_in_parallel_and_reused(cwd, tmp_path, monkeypatch):
+    """Confirm that many projects are integrated in separate processes and then reused."""
+    monkeypatch.setattr(main.os, "cpu_count", lambda: 2)
+    executor_workers = []
+
+    class RecordingProcessPoolExecutor(ProcessPoolExecutor):
+        """Record the number of processes that integrate the projects."""
+
+        def __init__(self, max_workers):
+            executor_workers.append(max_workers)
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(main, "ProcessPoolExecutor", RecordingProcessPoolExecutor)
+    create_chasten_results(cwd, tmp_path, "alpha")
+    create_chasten_results(cwd, tmp_path, "beta")
+    manifest_file = tmp_path / "manifest.yml"
+    manifest_file.write_text("alpha: alpha-results\nbeta: beta-results\n", "utf-8")
+    output_directory = tmp_path / "integrated"
+    output_directory.mkdir()
+    integrate_all_arguments = [
+        "integrate-all",
+        str(manifest_file),
+        "--save-directory",
+        str(output_directory),
+    ]
+    result = runner.invoke(main.cli, integrate_all_arguments)
+    assert result.exit_code == 0
+    assert result.output.count("Integrated the 1 file(s)") == 2  # noqa: PLR2004
+    assert len(list(output_directory.glob("chasten-flattened-*"))) == 2  # noqa: PLR2004
+    result = runner.invoke(main.cli, integrate_all_arguments)
+    assert result.exit_code == 0
+    assert result.output.count("Already integrated the 1 file(s)") == 2  # noqa: PLR2004
+    assert executor_workers == [2, 2]
+    assert len(list(output_directory.glob("chasten-flattened-*"))) == 2  # noqa: PLR2004
+
+
+def test_cli_integrate_all_reports_each_failure(cwd, tmp_path):
+    """Confirm that failing to integrate some projects does not stop the others."""
+    create_chasten_results(cwd, tmp_path, "alpha")
+    (tmp_path / "beta-results").mkdir()
+    (tmp_path / "beta-results" / "chasten-results-beta.json").write_text("{", "utf-8")
+    (tmp_path / "gamma-results").mkdir()
+    manifest_file = tmp_path / "manifest.yml"
+    manifest_file.write_text(
+        "alpha: alpha-results\nbeta: beta-results\ngamma: gamma-results\n", "utf-8"
+    )
+    output_directory = tmp_path / "integrated"
+    output_directory.mkdir()
+    result = runner.invoke(
+        main.cli,
+        [
+            "integrate-all",
+            str(manifest_file),
+            "--save-directory",
+            str(output_directory),
+        ],
+    )
+    assert result.exit_code == 1
+    assert "Integrated the 1 file(s) of 'alpha'" in result.output
+    assert "Cannot integrate 'beta' due to an error" in result.output
+    assert "Cannot integrate 'gamma' because there are no JSON" in result.output
+    assert "Could not integrate 2 of 3 project(s)" in result.output
+    assert len(list(output_directory.glob("chasten-flattened-*-alpha-*"))) == 1
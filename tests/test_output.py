@@ -0,0 +1,26 @@
+"""Pytest test suite for the output module."""
+
+from chasten import output
+
+
+def test_batch_console_displays_lines_at_exit():
+    """Confirm that the batched lines are only displayed when the batch is complete."""
+    with output.console.capture() as capture:
+        with output.BatchConsole() as batch_console:
+            batch_console.print("first line")
+            batch_console.print()
+            batch_console.print("second line")
+            assert len(batch_console.lines) == 3  # noqa: PLR2004
+        assert not batch_console.lines
+    assert capture.get() == "first line\n\nsecond line\n"
+
+
+def test_print_list_contents_joins_batch(tmp_path):
+    """Confirm that the contents of a list are displayed with the rest of a batch."""
+    with output.console.capture() as capture:
+        with output.BatchConsole() as batch_console:
+            batch_console.print("header")
+            output.print_list_contents([tmp_path / "a.json"], batch_console)
+            assert len(batch_console.lines) == 4  # noqa: PLR2004
+    assert capture.get().startswith("header\n")
+    assert "a.json" in capture.get()
@@ -1,5 +1,6 @@
 """Pytest test suite for the analyze module."""
 
+import json
 from pathlib import Path
 
 import pytest
@@ -7,7 +8,7 @@ from hypothesis import given
 from hypothesis import strategies as st
 from pyastgrep import search as pyastgrepsearch
 
-from chasten import process
+from chasten import filesystem, process
 
 
 @given(
@@ -55,3 +56,156 @@ def test_filter_matches_only_int_matches(match_list, data_type):
         assert filtered == []
     else:
         assert filtered != []
+
+
+def test_search_python_files_finds_matches(tmp_path):
+    """Confirm that searching the Python source files finds the matching AST nodes."""
+    source_file = tmp_path / "example.py"
+    source_file.write_text("def first():\n    pass\n\n\ndef second():\n    pass\n")
+    [matches] = process.search_python_files(
+        [source_file], [".//FunctionDef"], xpath2=False
+    )
+    assert [match.position.lineno for match in matches] == [1, 5]
+    assert all(match.path == source_file for match in matches)
+    assert matches[0].file_lines[0] == "def first():"
+
+
+def test_search_python_file_without_matches_omits_lines(tmp_path):
+    """Confirm that the lines of a file are only returned when the file has matches."""
+    source_file = tmp_path / "example.py"
+    source_file.write_text("x = 1\n")
+    search_result = process.search_python_file(
+        source_file, [".//ClassDef", ".//Assign"], xpath2=False
+    )
+    assert search_result is not None
+    assert search_result[0] == ["x = 1"]
+    search_result = process.search_python_file(
+        source_file, [".//ClassDef"], xpath2=False
+    )
+    assert search_result is not None
+    assert search_result[:2] == ([], [[]])
+
+
+def test_search_python_files_skips_invalid_source(tmp_path):
+    """Confirm that searching a file that is not valid Python does not produce matches."""
+    source_file = tmp_path / "invalid.py"
+    source_file.write_text("def broken(:\n")
+    assert process.search_python_files([source_file], [".//FunctionDef"]) == [[]]
+
+
+@pytest.mark.parametrize("xpath2", [False, True])
+def test_search_python_files_multiple_queries(tmp_path, xpath2):
+    """Confirm that each of the patterns has its own matches."""
+    source_file = tmp_path / "example.py"
+    source_file.write_text("class Example:\n    def method(self):\n        pass\n")
+    patterns = [
+        ".//ClassDef",
+        ".//FunctionDef",
+        ".//FunctionDef/args",
+        "count(.//FunctionDef)",
+    ]
+    (
+        class_matches,
+        function_matches,
+        field_matches,
+        count_matches,
+    ) = process.search_python_files([source_file], patterns, xpath2)
+    assert [match.position.lineno for match in class_matches] == [1]
+    assert [match.position.lineno for match in function_matches] == [2]
+    assert field_matches == []
+    assert count_matches == []
+
+
+def test_search_python_files_in_parallel(tmp_path, monkeypatch):
+    """Confirm that searching the files in separate processes finds the same matches."""
+    source_files = []
+    for number in range(10):
+        source_file = tmp_path / f"example_{number}.py"
+        source_file.write_text("def first():\n    pass\n" * (number + 1))
+        source_files.append(source_file)
+    sequential_matches = process.search_python_files(source_files, [".//FunctionDef"])
+    monkeypatch.setattr(process, "parallel_search_minimum_files", 1)
+    monkeypatch.setattr(process.os, "cpu_count", lambda: 2)
+    parallel_matches = process.search_python_files(source_files, [".//FunctionDef"])
+    assert [(m.path, m.position) for m in parallel_matches[0]] == [
+        (m.path, m.position) for m in sequential_matches[0]
+    ]
+    assert len(parallel_matches[0]) == sum(range(1, 11))
+
+
+def test_stream_organize_matches():
+    """Confirm that the matches are filtered, organized by file, and counted."""
+    first_match = pyastgrepsearch.Match(
+        path=Path("first.py"),
+        file_lines=[],
+        xml_element=None,
+        position=pyastgrepsearch.Position(1, 0),
+        ast_node=None,  # type: ignore
+    )
+    second_match = pyastgrepsearch.Match(
+        path=Path("second.py"),
+        file_lines=[],
+        xml_element=None,
+        position=pyastgrepsearch.Position(2, 0),
+        ast_node=None,  # type: ignore
+    )
+    match_dict, match_count = process.stream_organize_matches(
+        iter([first_match, None, second_match, first_match]), pyastgrepsearch.Match
+    )
+    assert match_count == 3  # noqa: PLR2004
+    assert match_dict == {
+        "first.py": [first_match, first_match],
+        "second.py": [second_match],
+    }
+
+
+def test_filter_checks_matches_separate_include_and_exclude():
+    """Confirm that filtering in one pass matches including and then excluding."""
+    check_list = [
+        {"id": "C001", "name": "count-functions", "description": "Count functions"},
+        {"id": "C002", "name": "count-classes", "description": "Count classes"},
+        {"id": "C003", "name": "count-imports", "description": "Count imports"},
+    ]
+    check_include = ("name", "count-functions", 50)
+    check_exclude = ("id", "C001", 100)
+    expected_check_list = process.include_or_exclude_checks(
+        check_list, *check_include, include=True  # type: ignore
+    )
+    expected_check_list = process.include_or_exclude_checks(
+        expected_check_list, *check_exclude, include=False  # type: ignore
+    )
+    assert (
+        process.filter_checks(check_list, check_include, check_exclude)  # type: ignore
+        == expected_check_list
+    )
+    assert process.filter_checks(check_list, (None, None, 0), (None, None, 0)) == (  # type: ignore
+        check_list
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["//FunctionDef", "body/FunctionDef", ".//Name[@id='x']", "count(//Name)"],
+)
+def test_search_xml_ast_with_reused_node_tree(tmp_path, pattern):
+    """Confirm that searching a reused tree of XPATH nodes finds the same positions."""
+    source_file = tmp_path / "example.py"
+    source_file.write_text("def f():\n    x = 1\n\nx = 2\n")
+    (xml_ast, _) = process.parse_python_file(source_file)  # type: ignore
+    query = process.compile_xpath(pattern, True)
+    assert process.search_xml_ast(
+        process.elementpath.get_node_tree(xml_ast), query
+    ) == process.search_xml_ast(xml_ast, query)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_combine_dicts(monkeypatch, use_orjson):
+    """Confirm that the dictionaries are combined into indented JSON with or without orjson."""
+    if not use_orjson:
+        monkeypatch.setattr(filesystem, "orjson", None)
+    dict_list = [{"sources": [{"filename": "ü.py", "count": 1}]}, {"sources": []}]
+    combined_json = process.combine_dicts(dict_list)
+    assert isinstance(combined_json, bytes)
+    assert json.loads(combined_json) == dict_list
+    assert combined_json.startswith(b'[\n  {\n    "sources": [')
+    assert '"ü.py"'.encode("utf-8") in combined_json